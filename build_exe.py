@@ -1,19 +1,54 @@
 import argparse
-import getpass
 import hashlib
+import mmap
 import os
 import shutil
 import subprocess
 import sys
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
+from typing import Any
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.prompt import Prompt
+try:
+    import blake3
+except ImportError:
+    blake3 = None  # type: ignore
+
+
+@lru_cache(maxsize=1)
+def _get_console():
+    """Import Rich only when something is printed, so --help stays fast."""
+    from rich.console import Console
+
+    return Console()
+
+
+class _LazyConsole:
+    """Module-level stand-in that forwards to the real Rich console."""
+
+    def __getattr__(self, name):
+        return getattr(_get_console(), name)
+
+
+console = _LazyConsole()
+
+
+def _spinner_progress():
+    """Create the transient spinner used for long-running steps."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=_get_console(),
+        transient=True,
+    )
 
-console = Console()
 
 # --- Configuration ---
 SCRIPT_DIR = Path(__file__).parent.resolve()  # Get script's absolute directory
@@ -22,24 +57,55 @@ MAIN_SCRIPT = SCRIPT_DIR / "run.py"
 EXE_NAME = "PDF Retriever.exe"
 VERSION_FILE = SCRIPT_DIR / "version_info.txt"
 ICON_FILE = SCRIPT_DIR / "assets/favicon.ico"
+ICON_ADD_DATA_ARG = f"--add-data={ICON_FILE}{os.pathsep}assets"
 
 DIST_PATH = SCRIPT_DIR / "dist"
 BUILD_PATH = SCRIPT_DIR / "build"
 EXE_PATH = DIST_PATH / EXE_NAME
+
+PYINSTALLER_LOG_TAIL = 500  # lines kept for error reporting
+
+# SHA-256 is always published; the others only go into the internal log.
+HASH_ALGORITHMS: dict[str, Callable[[], Any]] = {
+    "SHA-256": hashlib.sha256,
+    "SHA-512": hashlib.sha512,
+    "SHA3-256": hashlib.sha3_256,
+    "SHA3-512": hashlib.sha3_512,
+}
+DEFAULT_HASH_ALGORITHMS = ["SHA-256"]
+if blake3:
+    # BLAKE3 is SIMD-vectorised and multithreaded, so it is a cheap default
+    # for the internal integrity log.
+    def _blake3_factory() -> Any:
+        return blake3.blake3(max_threads=blake3.blake3.AUTO)
+
+    HASH_ALGORITHMS["BLAKE3"] = _blake3_factory
+    DEFAULT_HASH_ALGORITHMS.append("BLAKE3")
+
+# Certificates live at the project root or in certs/; never walk the whole tree.
+PFX_PATTERNS = ("*.pfx", "certs/*.pfx")
 # ---------------------
 
 
-def clean_build_artifacts():
-    """Remove previous build artifacts."""
+def clean_build_artifacts(fresh: bool = False):
+    """
+    Remove previous build artifacts.
+    build/ holds PyInstaller's analysis cache and is only removed when fresh.
+    """
     console.print("🧹 Cleaning up old build artifacts...")
     try:
-        if DIST_PATH.exists():
-            shutil.rmtree(DIST_PATH)
-        if BUILD_PATH.exists():
-            shutil.rmtree(BUILD_PATH)
+        # dist/ and build/ are independent trees; delete them concurrently.
+        # rmtree(ignore_errors=True) copes with a missing tree, so skip the exists() probe.
+        targets = (DIST_PATH, BUILD_PATH) if fresh else (DIST_PATH,)
+        with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+            list(executor.map(lambda p: shutil.rmtree(p, ignore_errors=True), targets))
+        if leftovers := [str(p) for p in targets if p.exists()]:
+            raise OSError(f"could not remove {', '.join(leftovers)}")
         # Search for .spec files in the script's directory
-        for f in SCRIPT_DIR.glob("*.spec"):
-            f.unlink()
+        with os.scandir(SCRIPT_DIR) as entries:
+            for entry in entries:
+                if entry.name.endswith(".spec") and entry.is_file():
+                    os.unlink(entry.path)
         console.print("[green]✓ Cleanup complete.[/green]")
     except Exception as e:
         console.print(f"[yellow]⚠ Could not clean all artifacts: {e}[/yellow]")
@@ -54,9 +120,12 @@ def _verify_files() -> bool:
     return True
 
 
-def _build_pyinstaller_args() -> list[str]:
+def _build_pyinstaller_args(fresh: bool = False) -> list[str]:
     """Construct the arguments for PyInstaller."""
     args = []
+    if fresh:
+        # Discards the cached module-graph analysis, the slowest build step.
+        args.append("--clean")
     if VERSION_FILE.exists():
         console.print("   [green]✓ Found version information[/green]")
         args.append(f"--version-file={VERSION_FILE}")
@@ -68,7 +137,7 @@ def _build_pyinstaller_args() -> list[str]:
     if ICON_FILE.exists():
         console.print("   [green]✓ Found icon file[/green]")
         args.append(f"--icon={ICON_FILE}")
-        args.append(f"--add-data={ICON_FILE}{os.pathsep}assets")
+        args.append(ICON_ADD_DATA_ARG)
     else:
         console.print(
             f"   [yellow]⚠ Icon file '{ICON_FILE}' not found, using default icon.[/yellow]"
@@ -79,8 +148,8 @@ def _build_pyinstaller_args() -> list[str]:
             "--onefile",
             "--windowed",
             f"--name={EXE_NAME.replace('.exe', '')}",
-            "--clean",
             "--noconfirm",
+            "--noupx",
             "--hidden-import=bibtexparser",
             "--hidden-import=rispy",
             "--hidden-import=requests",
@@ -99,24 +168,37 @@ def _build_pyinstaller_args() -> list[str]:
 
 def _execute_pyinstaller(args: list[str]) -> bool:
     """Execute the PyInstaller command."""
-    cmd = [sys.executable, "-m", "PyInstaller"] + args
+    from rich.markup import escape
+    from rich.panel import Panel
+
+    # -O (never -OO, which strips docstrings some dependencies rely on) makes
+    # PyInstaller collect optimised bytecode.
+    cmd = [sys.executable, "-O", "-m", "PyInstaller"] + args
     console.print(f"\nRunning PyInstaller for [cyan]{MAIN_SCRIPT.name}[/cyan]...")
 
     try:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-            transient=True,
-        ) as progress:
+        with _spinner_progress() as progress:
             task = progress.add_task(f"Building {EXE_NAME}...", total=None)
-            result = subprocess.run(
+            # Stream the log instead of buffering it; only the tail is kept
+            # for the error panels.
+            log_tail: deque[str] = deque(maxlen=PYINSTALLER_LOG_TAIL)
+            with subprocess.Popen(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
-                check=True,
                 encoding="utf-8",
-            )
+                bufsize=1,
+            ) as proc:
+                assert proc.stdout is not None
+                for line in proc.stdout:
+                    log_tail.append(line)
+                    if "INFO: " in line:
+                        step = line.split("INFO: ", 1)[1].strip()
+                        progress.update(task, description=escape(step[:80]))
+            build_log = "".join(log_tail)
+            if proc.returncode:
+                raise subprocess.CalledProcessError(proc.returncode, cmd, output=build_log)
             progress.update(
                 task, completed=True, description="[green]✓ Build complete[/green]"
             )
@@ -127,7 +209,7 @@ def _execute_pyinstaller(args: list[str]) -> bool:
             )
             console.print(
                 Panel(
-                    result.stdout,
+                    build_log,
                     title="PyInstaller Log",
                     style="yellow",
                     border_style="yellow",
@@ -142,10 +224,9 @@ def _execute_pyinstaller(args: list[str]) -> bool:
 
     except subprocess.CalledProcessError as e:
         console.print("[red]✗ Build failed[/red]")
-        error_output = e.stdout + "\n---\n" + e.stderr
         console.print(
             Panel(
-                error_output, title="PyInstaller Error", style="red", border_style="red"
+                e.stdout, title="PyInstaller Error", style="red", border_style="red"
             )
         )
         return False
@@ -159,18 +240,25 @@ def _execute_pyinstaller(args: list[str]) -> bool:
         return False
 
 
-def run_build():
+def run_build(fresh: bool = False):
     """Run the PyInstaller build process with a Rich display."""
     console.rule("📦 Building Executable with PyInstaller", style="bold cyan")
-    clean_build_artifacts()
+    clean_build_artifacts(fresh)
 
     if not _verify_files():
         return False
 
-    args = _build_pyinstaller_args()
+    args = _build_pyinstaller_args(fresh)
     return _execute_pyinstaller(args)
 
 
+def _sdk_version_key(path: Path) -> tuple[int, ...]:
+    """Sort key for SDK folders like 10.0.22621.0 (numeric, not lexicographic)."""
+    parts = path.name.split(".")
+    return tuple(int(p) for p in parts) if all(p.isdigit() for p in parts) else ()
+
+
+@lru_cache(maxsize=1)
 def find_signtool() -> Path | None:
     """Automatically find the path to signtool.exe."""
     if "ProgramFiles(x86)" not in os.environ:
@@ -179,14 +267,33 @@ def find_signtool() -> Path | None:
     if not base_path.exists():
         return None
 
-    signtool_paths = list(base_path.rglob("signtool.exe"))
-    if not signtool_paths:
-        return None
+    # SDK layout is bin\<version>\x64\signtool.exe; try the newest version first.
+    for version_dir in sorted(base_path.iterdir(), key=_sdk_version_key, reverse=True):
+        candidate = version_dir / "x64" / "signtool.exe"
+        if candidate.is_file():
+            return candidate
+
+    legacy = base_path / "x64" / "signtool.exe"
+    if legacy.exists():
+        return legacy
+
+    # Unknown layout: fall back to a recursive search, stopping at the first hit
+    # and skipping ARM toolchains we cannot run anyway.
+    for root, dirs, files in os.walk(base_path):
+        if "signtool.exe" in files:
+            return Path(root) / "signtool.exe"
+        dirs[:] = [d for d in dirs if "arm" not in d.lower()]
+    return None
 
-    x64_tool = next(
-        (path for path in signtool_paths if "x64" in str(path).lower()), None
-    )
-    return x64_tool or signtool_paths[0]
+
+@lru_cache(maxsize=1)
+def _scan_pfx() -> tuple[Path, ...]:
+    """
+    Return up to two .pfx files from the known certificate locations.
+    Callers only need to tell "none", "one" and "several" apart.
+    """
+    matches = (path for pattern in PFX_PATTERNS for path in SCRIPT_DIR.glob(pattern))
+    return tuple(islice(matches, 2))
 
 
 def _find_pfx_file() -> tuple[Path | None, bool]:
@@ -194,7 +301,7 @@ def _find_pfx_file() -> tuple[Path | None, bool]:
     Find the .pfx file.
     Returns: (path, success)
     """
-    pfx_files = list(SCRIPT_DIR.rglob("*.pfx"))
+    pfx_files = _scan_pfx()
     if not pfx_files:
         console.print(
             "[yellow]⚠ Signing skipped: No .pfx certificate file found.[/yellow]"
@@ -208,31 +315,41 @@ def _find_pfx_file() -> tuple[Path | None, bool]:
     return pfx_files[0], True
 
 
-def _perform_signing(signtool_path: Path, pfx_path: Path, exe_path: Path, password: str) -> bool:
-    """Execute the signing and verification commands."""
+def _perform_signing(
+    signtool_path: Path,
+    pfx_path: Path,
+    exe_paths: list[Path],
+    password: str,
+    verify: bool = True,
+) -> bool:
+    """
+    Execute the signing and verification commands.
+    All binaries go through a single signtool invocation per step.
+    """
+    from rich.panel import Panel
+
+    signtool, pfx = str(signtool_path), str(pfx_path)
+    exes = [str(p) for p in exe_paths]
+    sign_cmd = [
+        signtool,
+        "sign",
+        "/f",
+        pfx,
+        "/p",
+        password,
+        "/fd",
+        "sha256",
+        "/tr",
+        "http://timestamp.digicert.com",
+        "/td",
+        "sha256",
+        *exes,
+    ]
+    verify_cmd = [signtool, "verify", "/pa", "/v", *exes]
+
     try:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-            transient=True,
-        ) as progress:
+        with _spinner_progress() as progress:
             task = progress.add_task("Signing executable...", total=1)
-            sign_cmd = [
-                str(signtool_path),
-                "sign",
-                "/f",
-                str(pfx_path),
-                "/p",
-                password,
-                "/fd",
-                "sha256",
-                "/tr",
-                "http://timestamp.digicert.com",
-                "/td",
-                "sha256",
-                str(exe_path),
-            ]
             subprocess.run(
                 sign_cmd, capture_output=True, text=True, check=True, encoding="utf-8"
             )
@@ -240,20 +357,23 @@ def _perform_signing(signtool_path: Path, pfx_path: Path, exe_path: Path, passwo
                 task, advance=1, description="[green]✓ Executable signed[/green]"
             )
 
-            verify_task = progress.add_task("Verifying signature...", total=1)
-            verify_cmd = [str(signtool_path), "verify", "/pa", "/v", str(exe_path)]
-            subprocess.run(
-                verify_cmd, capture_output=True, check=True, encoding="utf-8"
-            )
-            progress.update(
-                verify_task,
-                advance=1,
-                description="[green]✓ Signature verified[/green]",
-            )
+            if verify:
+                verify_task = progress.add_task("Verifying signature...", total=1)
+                subprocess.run(
+                    verify_cmd, capture_output=True, check=True, encoding="utf-8"
+                )
+                progress.update(
+                    verify_task,
+                    advance=1,
+                    description="[green]✓ Signature verified[/green]",
+                )
 
-        console.print(
-            "[bold green]✅ Executable signed and verified successfully![/bold green]"
-        )
+        if verify:
+            console.print(
+                "[bold green]✅ Executable signed and verified successfully![/bold green]"
+            )
+        else:
+            console.print("[bold green]✅ Executable signed successfully![/bold green]")
         return True
 
     except subprocess.CalledProcessError as e:
@@ -265,7 +385,7 @@ def _perform_signing(signtool_path: Path, pfx_path: Path, exe_path: Path, passwo
         return False
 
 
-def run_signing(exe_path, cli_password=None):
+def run_signing(exe_paths: list[Path], cli_password=None, verify: bool = True):
     """Run code signing by automatically locating the .pfx and signtool.exe files."""
     console.rule("🔐 Code Signing", style="bold yellow")
 
@@ -289,54 +409,59 @@ def run_signing(exe_path, cli_password=None):
         if cli_password:
             password = cli_password
         else:
+            import getpass
+
             password = getpass.getpass("Enter PFX password: ")
 
-        return _perform_signing(signtool_path, pfx_path, exe_path, password)
+        return _perform_signing(signtool_path, pfx_path, exe_paths, password, verify)
     except Exception as e:
         console.print(f"[red]✗ Signing error: {e}[/red]")
         return False
 
 
 # --- FINAL INTEGRATED HASHING FUNCTION ---
-def _calculate_hashes(exe_path: Path) -> dict[str, str]:
-    """Calculate hashes for the executable using multiple algorithms."""
-    algorithms = {
-        "SHA-256": hashlib.sha256,
-        "SHA-512": hashlib.sha512,
-        "SHA3-256": hashlib.sha3_256,
-        "SHA3-512": hashlib.sha3_512,
+def _calculate_hashes(exe_path: Path, algorithms: list[str]) -> dict[str, str]:
+    """Calculate hashes for the executable using the selected algorithms."""
+    hashers = {
+        name: algo() for name, algo in HASH_ALGORITHMS.items() if name in algorithms
     }
 
-    hash_results = {}
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-        transient=True,
-    ) as progress:
-        task = progress.add_task("Calculating hashes...", total=len(algorithms))
-
-        for name, algo in algorithms.items():
-            progress.update(task, description=f"Calculating {name}...")
-            h = algo()
-            with open(exe_path, "rb") as f:
-                for chunk in iter(lambda: f.read(8192), b""):
-                    h.update(chunk)
-            hash_results[name] = h.hexdigest()
-            progress.update(task, advance=1)
+    with _spinner_progress() as progress:
+        progress.add_task("Calculating hashes...", total=None)
+
+        # Map the file once and hand the whole buffer to every hasher in
+        # parallel; each update is a single C call that releases the GIL.
+        # (mmap cannot map an empty file, whose digests need no input anyway.)
+        if exe_path.stat().st_size:
+            with open(exe_path, "rb") as f, ThreadPoolExecutor(max_workers=len(hashers)) as executor:
+                if hasattr(os, "posix_fadvise"):
+                    # Every hasher streams front to back; ask for aggressive readahead.
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    # result() re-raises a hasher's error instead of publishing
+                    # a digest of partial input.
+                    for future in [executor.submit(h.update, mm) for h in hashers.values()]:
+                        future.result()
+
+    hash_results = {name: h.hexdigest() for name, h in hashers.items()}
     return hash_results
 
 
 def _save_hash_files(exe_path: Path, hash_results: dict[str, str]):
     """Save the calculated hashes to files."""
-    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-
-    # ✅ Internal log with ALL algorithms
-    full_log = exe_path.parent / f"hashes_{timestamp}.txt"
-    with open(full_log, "w", encoding="utf-8") as f:
-        f.write(f"File: {exe_path.name}\nGenerated: {datetime.now()}\n\n")
-        for alg, value in hash_results.items():
-            f.write(f"{alg:<10}: {value}\n")
+    # One clock read so the log's file name and header always agree.
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d-%H%M%S")
+
+    # ✅ Internal log with ALL requested algorithms
+    full_log = None
+    if len(hash_results) > 1:
+        full_log = exe_path.parent / f"hashes_{timestamp}.txt"
+        with open(full_log, "w", encoding="utf-8") as f:
+            f.write(f"File: {exe_path.name}\nGenerated: {now}\n\n")
+            f.writelines(f"{alg:<10}: {value}\n" for alg, value in hash_results.items())
 
     # ✅ Public hash file — SHA-256 only
     sha256_value = hash_results["SHA-256"]
@@ -349,13 +474,14 @@ def _save_hash_files(exe_path: Path, hash_results: dict[str, str]):
     with open(sha256_file, "w", encoding="utf-8") as f:
         f.write(f"{sha256_value}  {exe_path.name}\n")
 
-    console.print(f"[green]✅ Internal hash log: {full_log}")
+    if full_log:
+        console.print(f"[green]✅ Internal hash log: {full_log}")
     console.print(f"[green]✅ Public hash file: {public_txt}")
     console.print(f"[green]✅ .sha256 checksum: {sha256_file}")
 
 
-def generate_and_save_hashes(exe_path: Path):
-    """Generate full internal hashes + public hash files."""
+def generate_and_save_hashes(exe_path: Path, algorithms: list[str] | None = None):
+    """Generate the requested internal hashes + public hash files."""
     console.rule("🧮 Generating File Hashes", style="bold blue")
 
     if not exe_path.exists():
@@ -364,18 +490,27 @@ def generate_and_save_hashes(exe_path: Path):
         )
         return
 
-    hash_results = _calculate_hashes(exe_path)
+    # The public hash files always need SHA-256.
+    selected = ["SHA-256", *(a for a in algorithms or [] if a != "SHA-256")]
+    hash_results = _calculate_hashes(exe_path, selected)
     _save_hash_files(exe_path, hash_results)
 
 
 def _should_sign(args) -> bool:
     """Determine if signing should be attempted."""
-    can_sign = any(SCRIPT_DIR.rglob("*.pfx")) and find_signtool()
+    from rich.prompt import Prompt
 
     if args.password:
         console.print("\nPassword provided via argument, attempting to sign...")
         return True
 
+    # The two lookups scan unrelated directories, so run them side by side.
+    # Both are cached, so run_signing reuses these results.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pfx_future = executor.submit(_scan_pfx)
+        signtool_future = executor.submit(find_signtool)
+        can_sign = bool(pfx_future.result()) and bool(signtool_future.result())
+
     if can_sign:
         sign = Prompt.ask(
             "\nProceed with code signing?", choices=["y", "n"], default="y"
@@ -393,21 +528,42 @@ def main():
         description="Build and optionally sign the PDF Retriever CLI."
     )
     parser.add_argument("-p", "--password", help="PFX password for code signing.")
+    parser.add_argument(
+        "--hash-algs",
+        nargs="+",
+        default=DEFAULT_HASH_ALGORITHMS,
+        choices=list(HASH_ALGORITHMS),
+        help="Hash algorithms to compute (SHA-256 is always included).",
+    )
+    parser.add_argument(
+        "--no-verify",
+        action="store_true",
+        help="Skip the signtool verification step after signing.",
+    )
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Discard PyInstaller's cached analysis and rebuild from scratch.",
+    )
     args = parser.parse_args()
 
     console.clear()
     console.rule("🚀 PDF Retriever Build, Sign & Hash", style="bold cyan")
 
-    if not run_build():
+    # run_build only succeeds once it has confirmed EXE_PATH exists.
+    if not run_build(fresh=args.fresh):
         return 1
 
-    if EXE_PATH.exists():
-        if _should_sign(args):
-            if not run_signing(EXE_PATH, cli_password=args.password):
-                console.print("[yellow]⚠ Build completed but signing failed.[/yellow]")
-        
-        # --- Hashing is now the final step in the workflow ---
-        generate_and_save_hashes(EXE_PATH)
+    if _should_sign(args):
+        if not run_signing(
+            [EXE_PATH], cli_password=args.password, verify=not args.no_verify
+        ):
+            console.print("[yellow]⚠ Build completed but signing failed.[/yellow]")
+
+    # --- Hashing is now the final step in the workflow ---
+    # signtool rewrites the EXE, so hashing cannot overlap with signing; the
+    # freshly signed file is still in the page cache when we read it here.
+    generate_and_save_hashes(EXE_PATH, args.hash_algs)
 
     console.rule("🎊 Process Complete", style="bold green")
     return 0
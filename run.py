@@ -1,7 +1,6 @@
 import logging
 import os
 import sys
-from logging.handlers import RotatingFileHandler
 
 
 def setup_logging():
@@ -9,43 +8,23 @@ def setup_logging():
     Configures the root logger to be quiet on console
     and detailed in a dedicated log file.
     """
+    from downloader.logging_setup import configure_logging
 
-    # --- 1. Create a dedicated 'logs' directory ---
+    # --- Logs live in a 'logs' directory next to the app/executable ---
     if getattr(sys, 'frozen', False):
         application_path = os.path.dirname(sys.executable)
     else:
         application_path = os.path.dirname(os.path.abspath(__file__))
-    
-    log_dir = os.path.join(application_path, "logs")
-    os.makedirs(log_dir, exist_ok=True)
 
-    # --- 2. Define the log format ---
-    log_format = logging.Formatter(
-        "%(asctime)s [%(levelname)-8s] [%(name)-25s] %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
-
-    # --- 3. Get the root logger ---
-    root_logger = logging.getLogger()
-    root_logger.setLevel(logging.DEBUG)  # Capture ALL log levels
-
-    # --- 4. Console Handler (Quiet) ---
-    # Only shows WARNINGS and ERRORS
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.WARNING)  # <-- This makes your console clean
-    console_handler.setFormatter(log_format)
-    root_logger.addHandler(console_handler)
-
-    # --- 5. Rotating File Handler (Detailed, in 'logs/' dir) ---
-    # Writes ALL (DEBUG) messages to a file inside the 'logs' folder
-    log_file_path = os.path.join(log_dir, "pdf_retriever.log")
+    log_file_path = os.path.join(application_path, "logs", "pdf_retriever.log")
 
-    file_handler = RotatingFileHandler(
-        log_file_path, maxBytes=5 * 1024 * 1024, backupCount=2, encoding="utf-8"
+    # Capture ALL levels in the file; the console only shows WARNINGS and ERRORS
+    configure_logging(
+        log_file_path,
+        level=logging.DEBUG,
+        backup_count=2,
+        console_level=logging.WARNING,
     )
-    file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(log_format)
-    root_logger.addHandler(file_handler)
 
 
 # --- Original code to add 'src' to path ---
@@ -1,14 +1,26 @@
+import argparse
 import subprocess
 import sys
 
+parser = argparse.ArgumentParser(description="Run the test suite.")
+parser.add_argument(
+    "--quiet", action="store_true", help="Capture pytest output and print it once finished."
+)
+args = parser.parse_args()
+
+cmd = [sys.executable, "-m", "pytest", "tests/", "-v"]
+
 try:
-    result = subprocess.run(
-        [sys.executable, "-m", "pytest", "tests/", "-v"],
-        capture_output=True,
-        text=True,
-        encoding='utf-8'
-    )
-    print("STDOUT:", result.stdout)
-    print("STDERR:", result.stderr)
+    if args.quiet:
+        result = subprocess.run(cmd, capture_output=True, text=True, encoding="utf-8")
+        print("STDOUT:", result.stdout)
+        print("STDERR:", result.stderr)
+        returncode = result.returncode
+    else:
+        # Inherit the terminal so pytest output appears as tests run.
+        returncode = subprocess.run(cmd).returncode
 except Exception as e:
     print(f"Error: {e}")
+    sys.exit(1)
+
+sys.exit(returncode)
@@ -1,13 +1,13 @@
 # src/downloader/cli.py
 import logging
-from logging.handlers import RotatingFileHandler
 import os
+import subprocess
 import sys
 from pathlib import Path
 
-from rich.logging import RichHandler
-
 from . import settings_manager
+from .core import Downloader, close_shared_connections
+from .logging_setup import configure_logging
 from .settings_manager import CONFIG_DIR
 from .tui import (
     clear_config,
@@ -27,46 +27,67 @@ from .tui import (
 LOG_FILE = CONFIG_DIR / "app.log"
 
 
-def _setup_logging(settings):
-    log_level_name = "DEBUG" if should_show_debug(settings or {}) else "WARNING"
-    log_level = logging.DEBUG if log_level_name == "DEBUG" else logging.WARNING
-
-    requests_log_level = (
-        logging.WARNING if log_level == logging.DEBUG else logging.ERROR
-    )
+def _log_levels(settings):
+    """Returns (app_level, http_libs_level) for the given settings."""
+    if should_show_debug(settings):
+        return logging.DEBUG, logging.WARNING
+    return logging.WARNING, logging.ERROR
 
-    file_handler = RotatingFileHandler(
-        LOG_FILE, maxBytes=5 * 1024 * 1024, backupCount=3, encoding="utf-8"
-    )
-    file_handler.setFormatter(
-        logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-    )
 
-    logging.basicConfig(
-        level=log_level,
-        format="%(message)s",
-        handlers=[
-            RichHandler(
-                console=console, show_path=False, rich_tracebacks=True, show_level=False
-            ),
-            file_handler,
-        ],
-    )
+def _apply_log_levels(settings):
+    # Gating on the logger level means filtered records are never created,
+    # let alone formatted.
+    log_level, requests_log_level = _log_levels(settings)
+    logging.getLogger().setLevel(log_level)
     logging.getLogger("urllib3").setLevel(requests_log_level)
     logging.getLogger("requests").setLevel(requests_log_level)
 
 
+def _setup_logging(settings):
+    configure_logging(LOG_FILE, backup_count=3, console=console)
+    _apply_log_levels(settings)
+
+
 def _update_logging(settings):
-    new_log_level_name = "DEBUG" if should_show_debug(settings) else "WARNING"
-    new_log_level = (
-        logging.DEBUG if new_log_level_name == "DEBUG" else logging.WARNING
+    _apply_log_levels(settings)
+
+
+# The Downloader for the current settings, kept between menu actions.
+_downloader: tuple[tuple, Downloader] | None = None
+
+
+def _get_downloader(settings):
+    """
+    Returns one Downloader per settings combination, so downloads and status
+    tests share a session whose keep-alive connections stay open.
+    """
+    global _downloader
+    key = (
+        settings["output_dir"],
+        settings["email"],
+        settings.get("core_api_key"),
+        settings["verify_ssl"],
+        settings["max_workers"],
     )
-    new_requests_log_level = (
-        logging.WARNING if new_log_level == logging.DEBUG else logging.ERROR
+    if _downloader and _downloader[0] == key:
+        return _downloader[1]
+    _close_downloader()
+    dl = Downloader(
+        output_dir=key[0],
+        email=key[1],
+        core_api_key=key[2],
+        verify_ssl=key[3],
+        max_workers=key[4],
     )
-    logging.getLogger().setLevel(new_log_level)
-    logging.getLogger("urllib3").setLevel(new_requests_log_level)
-    logging.getLogger("requests").setLevel(new_requests_log_level)
+    _downloader = (key, dl)
+    return dl
+
+
+def _close_downloader():
+    global _downloader
+    if _downloader:
+        _downloader[1].close()
+        _downloader = None
 
 
 def _open_output_folder(settings):
@@ -79,9 +100,9 @@ def _open_output_folder(settings):
     if os.name == "nt":
         os.startfile(out)
     elif sys.platform == "darwin":
-        os.system(f'open "{out}"')
+        subprocess.Popen(["open", str(out)])
     else:
-        os.system(f'xdg-open "{out}"')
+        subprocess.Popen(["xdg-open", str(out)])
 
 
 def _handle_configure_settings(settings, dois):
@@ -104,7 +125,7 @@ def _handle_begin_download(settings, dois):
     elif not dois:
         err("Load DOIs first.", {})
     else:
-        run_download(settings, dois)
+        run_download(settings, dois, _get_downloader(settings))
     input("\nPress Enter...")
     return settings, dois, True
 
@@ -125,13 +146,14 @@ def _handle_test_status(settings, dois):
     if not settings:
         err("Configure settings first.", {})
     else:
-        run_status_test(settings)
+        run_status_test(settings, _get_downloader(settings))
     input("\nPress Enter...")
     return settings, dois, True
 
 
 def _handle_clear_settings(settings, dois):
     clear_config()
+    _close_downloader()
     settings = None
     input("\nPress Enter...")
     return settings, dois, True
@@ -163,7 +185,7 @@ def main():
     dois: list = []
     while True:
         try:
-            os.system("cls" if os.name == "nt" else "clear")
+            # show_main_panel clears the screen itself.
             ch = show_main_panel(settings, dois)
             
             settings, dois, continue_loop = _handle_menu_choice(ch, settings, dois)
@@ -177,6 +199,8 @@ def main():
             logging.critical("Unhandled exception", exc_info=True)
             console.print(f"[bold red]An error occurred:[/bold red] {e}")
             input("\nPress Enter to continue...")
+    _close_downloader()
+    close_shared_connections()
 
 
 if __name__ == "__main__":
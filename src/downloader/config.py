@@ -1,8 +1,15 @@
 # downloader/config.py
 """Configuration constants for the downloader."""
 
+import itertools
+import random
+
 MAX_FILENAME_LEN = 200
 
+# Downloads are network-bound, so this is I/O concurrency, not a CPU count.
+DEFAULT_MAX_WORKERS = 32
+MAX_WORKERS_LIMIT = 64
+
 USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36",
@@ -10,6 +17,10 @@ USER_AGENTS = [
     "OA-PDF-Retriever/1.0 (https://github.com/user/repo; mailto:175473063+Zosick@users.noreply.github.com)",
 ]
 
+# Shuffled once, then handed out round-robin; next() on a cycle is atomic under the GIL.
+_shuffled_agents = random.sample(USER_AGENTS, len(USER_AGENTS))
+USER_AGENT_CYCLE = itertools.cycle(_shuffled_agents)
+
 UNPAYWALL_API_URL = "https://api.unpaywall.org/v2/{doi}"
 OPENALEX_API_URL = "https://api.openalex.org/works/https://doi.org/{doi}"
 SEMANTIC_SCHOLAR_API_URL = "https://api.semanticscholar.org/graph/v1/paper/DOI:{doi}"
@@ -23,3 +34,17 @@ ZENODO_API_URL = "https://zenodo.org/api/"
 OSF_API_URL = "https://api.osf.io/v2/"
 CROSSREF_API_URL = "https://api.crossref.org/"
 
+
+def _url_builder(template: str, field: str = "doi"):
+    """Splits a one-placeholder URL template once; calls then just concatenate."""
+    prefix, _, suffix = template.partition("{" + field + "}")
+    return lambda value: prefix + value + suffix
+
+
+# Callers pass the already-quoted DOI (or arXiv id).
+UNPAYWALL_URL = _url_builder(UNPAYWALL_API_URL)
+OPENALEX_URL = _url_builder(OPENALEX_API_URL)
+SEMANTIC_SCHOLAR_URL = _url_builder(SEMANTIC_SCHOLAR_API_URL)
+CORE_URL = _url_builder(CORE_API_URL)
+DOI_RESOLVER = _url_builder(DOI_RESOLVER_URL)
+ARXIV_PDF = _url_builder(ARXIV_PDF_URL, "arxiv_id")
@@ -1,7 +1,7 @@
 # src/downloader/core.py
 import logging
-import random
 import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
@@ -15,6 +15,58 @@ from .source_manager import SourceManager
 
 log = logging.getLogger(__name__)
 
+# Retry is immutable (urllib3 derives a new one per attempt), so every
+# session can share this one. Jitter keeps concurrent workers that were
+# throttled together from retrying in lockstep; a server's Retry-After
+# header still takes precedence over the computed backoff.
+_RETRY = Retry(
+    total=5,
+    backoff_factor=1,
+    backoff_jitter=1.0,
+    backoff_max=30,
+    status_forcelist=(408, 429, 500, 502, 503, 504),
+    respect_retry_after_header=True,
+)
+
+# Connection pools live in the adapter, so sharing adapters (not sessions)
+# lets later runs in the same process (each GUI download builds a new
+# Downloader) reuse warm keep-alive connections while headers such as the
+# User-Agent stay per Downloader. Keyed by SSL setting as well, since older
+# requests releases set cert_reqs on the pool itself. Evicted adapters are
+# closed; any Downloader still holding one just opens fresh connections.
+_ADAPTER_CACHE: OrderedDict[tuple[bool, int], HTTPAdapter] = OrderedDict()
+_ADAPTER_CACHE_SIZE = 4
+_ADAPTER_CACHE_LOCK = threading.Lock()
+
+
+def _shared_adapter(verify_ssl: bool, max_workers: int) -> HTTPAdapter:
+    """Returns the process-wide adapter for this SSL setting and pool size."""
+    key = (verify_ssl, max_workers)
+    with _ADAPTER_CACHE_LOCK:
+        adapter = _ADAPTER_CACHE.get(key)
+        if adapter is not None:
+            _ADAPTER_CACHE.move_to_end(key)
+            return adapter
+        # Size the pools to the worker count so concurrent downloads to one host
+        # don't hit "Connection pool is full, discarding connection".
+        adapter = _ADAPTER_CACHE[key] = HTTPAdapter(
+            pool_connections=max_workers,
+            pool_maxsize=max_workers * 2,
+            max_retries=_RETRY,
+        )
+        if len(_ADAPTER_CACHE) > _ADAPTER_CACHE_SIZE:
+            _ADAPTER_CACHE.popitem(last=False)[1].close()
+    return adapter
+
+
+def close_shared_connections() -> None:
+    """Closes the pooled connections kept for reuse; call when the app exits."""
+    with _ADAPTER_CACHE_LOCK:
+        for adapter in _ADAPTER_CACHE.values():
+            adapter.close()
+        _ADAPTER_CACHE.clear()
+
+
 class Downloader:
     """Manages the PDF download pipeline and metadata orchestration."""
 
@@ -24,11 +76,13 @@ class Downloader:
         email: str,
         core_api_key: str | None,
         verify_ssl: bool = True,
+        max_workers: int = config.DEFAULT_MAX_WORKERS,
     ):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.email = email
         self.verify_ssl = verify_ssl
+        self.max_workers = max_workers
         self.session = self._create_session()
         self.stats: dict[str, Any] = {"success": 0, "fail": 0, "skipped": 0, "sources": {}}
         self._stats_lock = threading.Lock()
@@ -38,24 +92,50 @@ class Downloader:
             self.source_manager,
             self.output_dir,
             self.stats,
-            self._stats_lock
+            self._stats_lock,
+            self.max_workers,
         )
 
     def _create_session(self) -> requests.Session:
         session = requests.Session()
-        session.headers["User-Agent"] = random.choice(config.USER_AGENTS)
+        session.headers["User-Agent"] = next(config.USER_AGENT_CYCLE)
         session.verify = self.verify_ssl
         if not self.verify_ssl:
             import urllib3
             urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
             log.warning("SSL verification disabled.")
 
-        retries = Retry(total=5, backoff_factor=1, status_forcelist=[408, 429, 500, 502, 503, 504])
-        adapter = HTTPAdapter(max_retries=retries)
+        adapter = _shared_adapter(self.verify_ssl, self.max_workers)
         session.mount("https://", adapter)
         session.mount("http://", adapter)
         return session
 
+    def prefetch_metadata(self, dois: list[str]) -> None:
+        """
+        Warms source caches for a whole batch before per-DOI processing starts.
+        arXiv answers many ids in one query instead of one rate-limited call each.
+        """
+        try:
+            self.source_manager.arxiv_source.get_metadata_batch(dois)
+        except Exception as e:
+            log.warning(f"Metadata prefetch failed: {e}")
+
+    def reset_stats(self) -> None:
+        """
+        Zeroes the counters in place (the pipeline holds a reference to this
+        dict) and drops the sources' memoized lookups from the previous run.
+        """
+        with self._stats_lock:
+            self.stats.update(success=0, fail=0, skipped=0, sources={})
+        self.source_manager.clear_metadata_caches()
+
+    def close(self) -> None:
+        """
+        Releases the background lookup threads; call once the Downloader is done.
+        The session is not closed, as that would close the shared adapters.
+        """
+        self.pipeline.close()
+
     def download_one(self, doi: str, cancel_event: threading.Event | None = None) -> dict[str, Any]:
         """Runs full download pipeline for one DOI with cancel support."""
         return self.pipeline.download_one(doi, cancel_event)
@@ -22,7 +22,11 @@ class DownloadExecutor:
         log.info(f"Success ({source_name}): {doi} -> {filename}")
 
     def check_if_skipped(self, ctx: DownloadContext) -> dict[str, Any] | None:
-        if ctx.filepath.exists() and ctx.filepath.stat().st_size > 5000:
+        try:
+            already_saved = ctx.filepath.stat().st_size > 5000
+        except OSError:
+            already_saved = False
+        if already_saved:
             with self._stats_lock:
                 self.stats["skipped"] += 1
             return {
@@ -39,35 +43,61 @@ class DownloadExecutor:
         if ctx.cancel_event and ctx.cancel_event.is_set():
             return None
             
-        if self.source_manager.unpaywall_source._fetch_and_save(primary_pdf_url, ctx.filepath):
-            self._record_outcome(ctx.doi, "Unpaywall", ctx.filename)
+        # Fetch through the source that found the link so it is paced and
+        # credited correctly; links of unknown origin go through Unpaywall.
+        # Without a finder the link is left to the normal pipeline.
+        source_name = next(iter(ctx.pdf_urls), None)
+        if source_name is None:
+            return None
+        source = (
+            self.source_manager.sources_by_name.get(source_name)
+            or self.source_manager.unpaywall_source
+        )
+        saved = source._fetch_and_save(primary_pdf_url, ctx.filepath)
+        self.source_manager.record_attempt(ctx.doi, source.name, saved)
+        if saved:
+            self._record_outcome(ctx.doi, source.name, ctx.filename)
             return {
                 "doi": ctx.doi,
                 "status": "success",
-                "source": "Unpaywall",
+                "source": source.name,
                 "filename": str(ctx.filepath),
                 "citation": ctx.citation,
             }
         return None
 
     def try_pipeline_sources(self, ctx: DownloadContext) -> dict[str, Any] | None:
-        for source in self.source_manager.pipeline:
+        # Links that already failed (the primary one included) aren't fetched
+        # again, but the sources that found them still get to try other routes.
+        tried = set(list(ctx.pdf_urls.values())[:1])
+        for source in self.source_manager.pipeline_for(ctx.doi):
             if ctx.cancel_event and ctx.cancel_event.is_set():
                 return {
                     "doi": ctx.doi,
                     "status": "error",
                     "message": "Cancelled mid-pipeline",
                 }
+            # Each source gets the link it found itself, not whichever source's
+            # link ended up in the merged metadata; without one it looks it up.
+            pdf_url = ctx.pdf_urls.get(source.name)
+            if pdf_url in tried:
+                pdf_url = None
+            metadata = {**ctx.metadata, "_pdf_url": pdf_url}
             try:
-                if source.download(ctx.doi, ctx.filepath, ctx.metadata):
-                    self._record_outcome(ctx.doi, source.name, ctx.filename)
-                    return {
-                        "doi": ctx.doi,
-                        "status": "success",
-                        "source": source.name,
-                        "filename": str(ctx.filepath),
-                        "citation": ctx.citation,
-                    }
+                saved = source.download_avoiding(ctx.doi, ctx.filepath, metadata, tried)
             except Exception as e:
                 log.warning(f"{source.name} failed: {e}")
+                saved = False
+            self.source_manager.record_attempt(ctx.doi, source.name, saved)
+            if saved:
+                self._record_outcome(ctx.doi, source.name, ctx.filename)
+                return {
+                    "doi": ctx.doi,
+                    "status": "success",
+                    "source": source.name,
+                    "filename": str(ctx.filepath),
+                    "citation": ctx.citation,
+                }
+            if pdf_url:
+                tried.add(pdf_url)
         return None
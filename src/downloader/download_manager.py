@@ -18,6 +18,7 @@ from pathlib import Path
 from typing import Any
 
 from .core import Downloader
+from .utils import interleave_by_prefix
 
 
 class DownloadManager(threading.Thread):
@@ -44,6 +45,7 @@ class DownloadManager(threading.Thread):
             email=settings["email"],
             core_api_key=settings.get("core_api_key"),
             verify_ssl=settings["verify_ssl"],
+            max_workers=settings["max_workers"],
         )
         self.executor = None
         self.future_map: dict[Future[Any], str] = {}
@@ -65,7 +67,7 @@ class DownloadManager(threading.Thread):
             self.executor.submit(
                 self.downloader.download_one, doi, self._cancel_event
             ): doi
-            for doi in self.dois
+            for doi in interleave_by_prefix(self.dois)
         }
 
     def _process_completed_future(self, future: Future[Any], doi: str) -> tuple[int, int, int]:
@@ -148,6 +150,7 @@ class DownloadManager(threading.Thread):
             self.progress_queue.put(
                 {"status": "start", "message": "--- Starting Download ---"}
             )
+            self.downloader.prefetch_metadata(self.dois)
             self.future_map = self._submit_tasks()
             pending_futures = set(self.future_map.keys())
 
@@ -169,6 +172,7 @@ class DownloadManager(threading.Thread):
             if self.executor:
                 self.executor.shutdown(wait=True, cancel_futures=True)
             self.executor = None
+            self.downloader.close()
             self.future_map = {}
             self.progress_queue.put({"status": "finished"})
 
@@ -3,25 +3,44 @@ import threading
 from pathlib import Path
 from typing import Any
 
+from . import config
 from .download_executor import DownloadExecutor
 from .filename_generator import FilenameGenerator
+from .metadata_cache import open_metadata_cache
 from .metadata_fetcher import MetadataFetcher
 from .source_manager import SourceManager
 from .types import DownloadContext
-from .utils import format_authors_apa
+from .utils import clean_doi, format_authors_apa
 
 log = logging.getLogger(__name__)
 
 class DownloadPipeline:
-    def __init__(self, source_manager: SourceManager, output_dir: Path, stats: dict[str, Any], stats_lock: threading.Lock):
+    def __init__(
+        self,
+        source_manager: SourceManager,
+        output_dir: Path,
+        stats: dict[str, Any],
+        stats_lock: threading.Lock,
+        max_workers: int = config.DEFAULT_MAX_WORKERS,
+    ):
         self.source_manager = source_manager
         self.output_dir = output_dir
         self.stats = stats
         self._stats_lock = stats_lock
-        self.metadata_fetcher = MetadataFetcher(self.source_manager)
+        cache = self.metadata_cache = open_metadata_cache(self.output_dir)
+        self.metadata_fetcher = MetadataFetcher(self.source_manager, cache, max_workers)
+        if cache:
+            # Per-prefix download outcomes live next to the metadata, so the
+            # pipeline order keeps learning across runs.
+            self.source_manager.use_stats_store(cache)
         self.filename_generator = FilenameGenerator()
         self.download_executor = DownloadExecutor(self.source_manager, self.stats, self._stats_lock)
 
+    def close(self) -> None:
+        self.metadata_fetcher.close()
+        if self.metadata_cache:
+            self.metadata_cache.close()
+
     def _create_download_context(self, doi: str, cancel_event: threading.Event | None) -> tuple[DownloadContext | None, str | None, dict[str, Any] | None]:
         """
         Orchestrates metadata fetching and context creation.
@@ -31,7 +50,8 @@ class DownloadPipeline:
             return None, None, {"doi": doi, "status": "error", "message": "Cancelled before start"}
 
         # Fetch metadata using MetadataFetcher
-        metadata, primary_pdf_url = self.metadata_fetcher.fetch_metadata(doi)
+        metadata, pdf_urls = self.metadata_fetcher.fetch_metadata(doi)
+        primary_pdf_url = next(iter(pdf_urls.values()), None)
 
         if cancel_event and cancel_event.is_set():
              return None, None, {"doi": doi, "status": "error", "message": "Cancelled during metadata fetch"}
@@ -39,12 +59,12 @@ class DownloadPipeline:
         if metadata is None:
             metadata = {"doi": doi}
 
-        filename = self.filename_generator.generate_filename(metadata)
+        # Formatted once; both the filename and the citation need it.
+        author_str = format_authors_apa(metadata.get("authors", []))
+        filename = self.filename_generator.generate_filename(metadata, author_str)
         filepath = self.output_dir / filename
 
-        authors = metadata.get("authors", [])
         year = metadata.get("year", "n.d.")
-        author_str = format_authors_apa(authors)
         citation = f"{author_str}, {year}" if author_str else year
 
         ctx = DownloadContext(
@@ -53,12 +73,21 @@ class DownloadPipeline:
             filename=filename,
             citation=citation,
             metadata=metadata,
-            cancel_event=cancel_event
+            cancel_event=cancel_event,
+            pdf_urls=pdf_urls,
         )
         return ctx, primary_pdf_url, None
 
     def download_one(self, doi: str, cancel_event: threading.Event | None = None) -> dict[str, Any]:
         """Runs full download pipeline for one DOI with cancel support."""
+        # Reject garbage before it costs a request to every metadata source.
+        cleaned = clean_doi(doi)
+        if not cleaned:
+            with self._stats_lock:
+                self.stats["fail"] += 1
+            return {"doi": doi, "status": "failed", "message": "Malformed DOI"}
+        doi = cleaned
+
         ctx, primary_pdf_url, error = self._create_download_context(doi, cancel_event)
         if error:
             return error
@@ -4,12 +4,13 @@ from .utils import format_authors_apa, safe_filename
 
 
 class FilenameGenerator:
-    def generate_filename(self, metadata: dict[str, Any]) -> str:
+    def generate_filename(self, metadata: dict[str, Any], author_str: str | None = None) -> str:
         title = (metadata.get("title") or "Unknown Title").strip()
         year = (metadata.get("year") or "Unknown").strip()
         authors = metadata.get("authors", [])
         doi_part = metadata.get("doi", "unknown").replace("/", "_")
-        author_str = format_authors_apa(authors)
+        if author_str is None:
+            author_str = format_authors_apa(authors)
         parts = []
         
         if author_str != "Unknown Author" and year != "Unknown":
@@ -9,11 +9,11 @@ from tkinter import filedialog, messagebox
 
 import customtkinter
 
-from .. import parsers, settings_manager
-from ..core import Downloader
+from .. import config, parsers, settings_manager
+from ..core import Downloader, close_shared_connections
 from ..download_manager import DownloadManager
 from ..protocol import ProgressQueue
-from ..utils import clean_doi
+from ..utils import DOI_SPLIT_REGEX, clean_doi
 from .doi_frame import DoiFrame
 from .right_frame import RightFrame
 from .settings_frame import SettingsFrame
@@ -97,6 +97,7 @@ class App(customtkinter.CTk):
                 self.download_manager.join()
         except Exception as e:
             print(f"Error during shutdown: {e}")
+        close_shared_connections()
         self.destroy()
 
     def toggle_ui_lock(self, locked: bool):
@@ -141,7 +142,7 @@ class App(customtkinter.CTk):
         if not verify_ssl:
             self.settings_frame.ssl_checkbox.select()
             
-        max_workers = settings.get("max_workers", 10) if settings else 10
+        max_workers = (settings or {}).get("max_workers", config.DEFAULT_MAX_WORKERS)
         self.settings_frame.parallel_downloads_slider.set(max_workers)
         self.update_parallel_downloads_label(max_workers)
         
@@ -207,7 +208,7 @@ class App(customtkinter.CTk):
     def get_dois_from_textbox(self):
         raw_text = self.doi_frame.doi_textbox.get("1.0", "end")
         dois = set()
-        for token in re.split(r"[,\s\n]+", raw_text):
+        for token in DOI_SPLIT_REGEX.split(raw_text):
             if cleaned := clean_doi(token.strip()):
                 dois.add(cleaned)
         return sorted(list(dois))
@@ -523,7 +524,10 @@ class App(customtkinter.CTk):
             core_api_key=settings.get("core_api_key"),
             verify_ssl=settings["verify_ssl"],
         )
-        results = downloader.test_connections()
+        try:
+            results = downloader.test_connections()
+        finally:
+            downloader.close()
         results.sort(key=lambda r: r.get("name", "Z_Fallback"))
 
         self.after(0, self.log_message, f"{'Source':<20} {'Status':<8} {'Details'}")
@@ -1,5 +1,7 @@
 import customtkinter
 
+from .. import config
+
 
 class SettingsFrame(customtkinter.CTkScrollableFrame):
     """Frame for all user-configurable settings."""
@@ -100,7 +102,7 @@ class SettingsFrame(customtkinter.CTkScrollableFrame):
 
     def _create_parallel_downloads_widget(self):
         self.parallel_downloads_label = customtkinter.CTkLabel(
-            self, text="Parallel Downloads: 10"
+            self, text=f"Parallel Downloads: {config.DEFAULT_MAX_WORKERS}"
         )
         self.parallel_downloads_label.grid(
             row=self.current_row, column=0, columnspan=2, padx=10, pady=(5, 0), sticky="w"
@@ -109,14 +111,14 @@ class SettingsFrame(customtkinter.CTkScrollableFrame):
         self.parallel_downloads_slider = customtkinter.CTkSlider(
             self,
             from_=1,
-            to=20,
-            number_of_steps=19,
+            to=config.MAX_WORKERS_LIMIT,
+            number_of_steps=config.MAX_WORKERS_LIMIT - 1,
             command=self.controller.update_parallel_downloads_label,
         )
         self.parallel_downloads_slider.grid(
             row=self.current_row, column=0, columnspan=2, padx=10, pady=(0, 5), sticky="we"
         )
-        self.parallel_downloads_slider.set(10)
+        self.parallel_downloads_slider.set(config.DEFAULT_MAX_WORKERS)
         self.current_row += 1
 
     def _create_completion_popup_widget(self):
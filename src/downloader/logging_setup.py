@@ -0,0 +1,58 @@
+# src/downloader/logging_setup.py
+"""Shared root-logger configuration for the GUI and CLI entry points."""
+
+import logging
+import sys
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import Any
+
+LOG_FORMAT = "%(asctime)s [%(levelname)-8s] [%(name)-25s] %(message)s"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+MAX_LOG_BYTES = 5 * 1024 * 1024
+
+
+def configure_logging(
+    log_file: str | Path,
+    *,
+    level: int = logging.DEBUG,
+    backup_count: int = 2,
+    console: Any = None,
+    console_level: int = logging.NOTSET,
+) -> logging.Logger:
+    """
+    Attaches a rotating file handler and a console handler to the root logger.
+    Passing a Rich `console` routes console output through RichHandler;
+    otherwise a plain stdout handler is used.
+    """
+    log_file = Path(log_file)
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+    formatter = logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT)
+
+    console_handler: logging.Handler
+    if console is not None:
+        # Imported lazily so the GUI path never pays for Rich's logging module.
+        from rich.logging import RichHandler
+
+        console_handler = RichHandler(
+            console=console, show_path=False, rich_tracebacks=True, show_level=False
+        )
+        console_handler.setFormatter(logging.Formatter("%(message)s"))
+    else:
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(formatter)
+    console_handler.setLevel(console_level)
+
+    file_handler = RotatingFileHandler(
+        log_file, maxBytes=MAX_LOG_BYTES, backupCount=backup_count, encoding="utf-8"
+    )
+    file_handler.setFormatter(formatter)
+
+    # Attach handlers directly: basicConfig silently does nothing if anything
+    # configured the root logger first.
+    root = logging.getLogger()
+    root.handlers.clear()
+    root.addHandler(console_handler)
+    root.addHandler(file_handler)
+    root.setLevel(level)
+    return root
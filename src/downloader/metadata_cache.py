@@ -0,0 +1,169 @@
+# src/downloader/metadata_cache.py
+"""On-disk cache of per-source metadata lookups and outcomes, shared across runs."""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+log = logging.getLogger(__name__)
+
+CACHE_FILENAME = ".meta_cache.db"
+POSITIVE_TTL = 90 * 86400  # seconds; bibliographic metadata rarely changes
+# Only definitive "not found" answers are stored; the API's coverage can
+# still change, so they are re-checked after a day.
+NEGATIVE_TTL = 86400
+WRITE_BATCH_SIZE = 50  # buffered rows per commit
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS metadata (
+    source TEXT NOT NULL,
+    doi TEXT NOT NULL,
+    json TEXT,
+    status INTEGER NOT NULL,
+    fetched_at INTEGER NOT NULL,
+    PRIMARY KEY (source, doi)
+);
+CREATE TABLE IF NOT EXISTS source_stats (
+    prefix TEXT NOT NULL,
+    source TEXT NOT NULL,
+    wins INTEGER NOT NULL,
+    tries INTEGER NOT NULL,
+    PRIMARY KEY (prefix, source)
+);
+"""
+
+_MISS = object()
+
+
+class MetadataCache:
+    """SQLite-backed (source, DOI) -> metadata cache; safe to share between threads."""
+
+    def __init__(self, path: str | Path):
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = sqlite3.connect(
+            str(path), check_same_thread=False
+        )
+        # Writes are buffered and committed WRITE_BATCH_SIZE rows at a time.
+        self._pending_metadata: dict[tuple[str, str], tuple[str | None, int, int]] = {}
+        self._pending_stats: list[tuple[str, str, int]] = []
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+            self._conn.commit()
+
+    def get(self, source: str, doi: str) -> Any:
+        """Returns the cached metadata (possibly None), or _MISS if absent or stale."""
+        with self._lock:
+            row = self._pending_metadata.get((source, doi))
+            if row is None and self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT json, status, fetched_at FROM metadata WHERE source = ? AND doi = ?",
+                    (source, doi),
+                ).fetchone()
+        if row is None:
+            return _MISS
+        payload, status, fetched_at = row
+        ttl = POSITIVE_TTL if status else NEGATIVE_TTL
+        if time.time() - fetched_at > ttl:
+            return _MISS
+        return json.loads(payload) if status and payload is not None else None
+
+    def put(self, source: str, doi: str, metadata: dict[str, Any] | None) -> None:
+        """Stores a definitive answer; None means the source has no record of `doi`."""
+        try:
+            payload = json.dumps(metadata) if metadata else None
+        except (TypeError, ValueError):
+            return
+        with self._lock:
+            if self._conn is None:
+                return
+            self._pending_metadata[(source, doi)] = (
+                payload, 1 if metadata else 0, int(time.time())
+            )
+            if len(self._pending_metadata) >= WRITE_BATCH_SIZE:
+                self._flush_locked()
+
+    def get_or_fetch(
+        self,
+        source: str,
+        doi: str,
+        fetch: Callable[[], tuple[dict[str, Any] | None, bool]],
+    ) -> dict[str, Any] | None:
+        """
+        `fetch` returns (metadata, definitive). Only definitive answers are
+        stored, so a lookup that failed on a network error is retried next time.
+        """
+        cached = self.get(source, doi)
+        if cached is not _MISS:
+            return cached
+        metadata, definitive = fetch()
+        if definitive:
+            self.put(source, doi, metadata)
+        return metadata
+
+    def source_stats(self) -> list[tuple[str, str, int, int]]:
+        """Returns (prefix, source, wins, tries) for every recorded download attempt."""
+        with self._lock:
+            if self._conn is None:
+                return []
+            self._flush_locked()
+            return self._conn.execute(
+                "SELECT prefix, source, wins, tries FROM source_stats"
+            ).fetchall()
+
+    def record_source_attempt(self, prefix: str, source: str, success: bool) -> None:
+        with self._lock:
+            if self._conn is None:
+                return
+            self._pending_stats.append((prefix, source, int(success)))
+            if len(self._pending_stats) >= WRITE_BATCH_SIZE:
+                self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if self._conn is None:
+            return
+        try:
+            if self._pending_metadata:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO metadata VALUES (?, ?, ?, ?, ?)",
+                    [(*key, *row) for key, row in self._pending_metadata.items()],
+                )
+            if self._pending_stats:
+                self._conn.executemany(
+                    "INSERT INTO source_stats VALUES (?, ?, ?, 1) "
+                    "ON CONFLICT (prefix, source) "
+                    "DO UPDATE SET wins = wins + excluded.wins, tries = tries + 1",
+                    self._pending_stats,
+                )
+            self._conn.commit()
+        except sqlite3.Error as e:
+            log.warning(f"Metadata cache write failed: {e}")
+        self._pending_metadata.clear()
+        self._pending_stats.clear()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        """Writes buffered rows and closes the database; later writes are dropped."""
+        with self._lock:
+            if self._conn is None:
+                return
+            self._flush_locked()
+            self._conn.close()
+            self._conn = None
+
+
+def open_metadata_cache(output_dir: Path) -> MetadataCache | None:
+    """Opens the cache in `output_dir`; a broken cache only disables caching."""
+    try:
+        return MetadataCache(output_dir / CACHE_FILENAME)
+    except sqlite3.Error as e:
+        log.warning(f"Metadata cache unavailable: {e}")
+        return None
@@ -1,19 +1,55 @@
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from typing import Any
 
+from .metadata_cache import MetadataCache
 from .source_manager import SourceManager
 from .sources import Source
 
 log = logging.getLogger(__name__)
 
+METADATA_TIMEOUT = 30  # seconds a started metadata lookup may take
+# Sources pace their own requests (see Source._rate_limit), so more lookups
+# per source than this only park threads, and their pooled connections, in
+# rate-limit sleeps.
+METADATA_WORKERS_PER_SOURCE = 4
+
+
 class MetadataFetcher:
-    def __init__(self, source_manager: SourceManager):
+    def __init__(
+        self,
+        source_manager: SourceManager,
+        cache: MetadataCache | None = None,
+        max_workers: int = 1,
+    ):
         self.source_manager = source_manager
+        self.cache = cache
+        # Shared by every DOI, so a batch doesn't create and tear down a pool
+        # per DOI. Up to METADATA_WORKERS_PER_SOURCE concurrent DOIs can have
+        # all of their lookups running at once; later ones queue (their timeout
+        # starts when they run). Threads are spawned on demand.
+        per_source = min(max_workers, METADATA_WORKERS_PER_SOURCE)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, per_source * len(self.source_manager.metadata_sources)),
+            thread_name_prefix="metadata",
+        )
 
-    def _fetch_single_source_metadata(self, source: Source, doi: str) -> tuple[dict[str, Any] | None, str | None, str]:
+    def close(self) -> None:
+        """Releases the lookup threads; lookups still running finish in the background."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _fetch_single_source_metadata(
+        self, source: Source, doi: str, started: dict[str, float]
+    ) -> tuple[dict[str, Any] | None, str | None, str]:
+        started[source.name] = time.monotonic()
         try:
-            temp_meta = source.get_metadata(doi)
+            if self.cache:
+                temp_meta = self.cache.get_or_fetch(
+                    source.name, doi, lambda: source.lookup_metadata(doi)
+                )
+            else:
+                temp_meta = source.get_metadata(doi)
             pdf_url = temp_meta.get("_pdf_url") if temp_meta else None
             return temp_meta, pdf_url, source.name
         except Exception:
@@ -22,7 +58,7 @@ class MetadataFetcher:
     def _process_metadata_result(self, future: Any, current_metadata: dict[str, Any] | None) -> tuple[dict[str, Any] | None, str | None, bool]:
         """
         Processes a single future result from metadata fetching.
-        Returns (updated_metadata, primary_pdf_url, should_break).
+        Returns (updated_metadata, pdf_url, should_break).
         """
         try:
             temp_meta, pdf_url, source_name = future.result()
@@ -33,28 +69,59 @@ class MetadataFetcher:
                 # Short-circuit: stop if we got high-confidence source
                 if source_name in high_confidence_sources and current_metadata.get("title"):
                     return current_metadata, pdf_url, True
-                return current_metadata, pdf_url, False
+            return current_metadata, pdf_url, False
         except Exception:
             pass
         return current_metadata, None, False
 
-    def fetch_metadata(self, doi: str) -> tuple[dict[str, Any] | None, str | None]:
+    def fetch_metadata(self, doi: str) -> tuple[dict[str, Any] | None, dict[str, str]]:
         """
-        Fetches metadata from multiple sources in parallel and returns the best result.
-        Stops early if a high-confidence source (Crossref, Unpaywall) succeeds.
+        Fetches metadata from all sources in parallel and returns the first result,
+        plus the PDF links seen, keyed by source name in the order they arrived.
+        Stops early once a high-confidence source (Crossref, Unpaywall) succeeds or
+        both metadata and a PDF link are known; queued lookups are then cancelled.
         """
         metadata = None
-        primary_pdf_url = None
-        
-        # Parallel fetch with max 4 workers to respect API rate limits
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            futures = {executor.submit(self._fetch_single_source_metadata, s, doi): s for s in self.source_manager.metadata_sources}
-            
-            for future in as_completed(futures):
-                metadata, pdf_url, should_break = self._process_metadata_result(future, metadata)
-                if pdf_url:
-                    primary_pdf_url = pdf_url
-                if should_break:
+        pdf_urls: dict[str, str] = {}
+
+        # Each lookup's METADATA_TIMEOUT starts when a worker picks it up, so
+        # lookups queued behind other DOIs are not given up before they run.
+        started: dict[str, float] = {}
+        futures: dict[Future[Any], str] = {
+            self._executor.submit(self._fetch_single_source_metadata, s, doi, started): s.name
+            for s in self.source_manager.metadata_sources
+        }
+        pending = set(futures)
+        try:
+            while pending:
+                now = time.monotonic()
+                expired = {
+                    f for f in pending
+                    if now - started.get(futures[f], now) >= METADATA_TIMEOUT
+                }
+                if expired:
+                    log.debug(f"Metadata lookup for {doi} timed out; using what arrived.")
+                    pending -= expired
+                    if not pending:
+                        break
+                oldest = min((started.get(futures[f], now) for f in pending), default=now)
+                done, pending = wait(
+                    pending,
+                    timeout=METADATA_TIMEOUT - (now - oldest),
+                    return_when=FIRST_COMPLETED,
+                )
+                should_stop = False
+                for future in done:
+                    metadata, pdf_url, should_break = self._process_metadata_result(future, metadata)
+                    if pdf_url:
+                        pdf_urls.setdefault(futures[future], pdf_url)
+                    should_stop = should_stop or should_break or bool(metadata and pdf_urls)
+                if should_stop:
                     break
-        
-        return metadata, primary_pdf_url
+        finally:
+            # Lookups that are already running finish in the background;
+            # queued ones never start.
+            for future in futures:
+                future.cancel()
+
+        return metadata, pdf_urls
@@ -3,7 +3,7 @@
 
 import json
 import re
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
 from pathlib import Path
 from typing import Any
 
@@ -78,32 +78,57 @@ def _detect_parser_from_content(text: str) -> Callable[[str], list[str]]:
     return _parse_plain_text
 
 
-def extract_dois_from_file(filepath: str) -> list[str]:
+PARSER_MAP: dict[str, Callable[[str], list[str]]] = {
+    ".bib": _parse_bibtex,
+    ".ris": _parse_ris,
+    ".xml": _parse_endnote_xml,
+    ".enw": _parse_endnote_xml,
+    ".json": _parse_json,
+}
+
+# Bytes read up front to sniff RIS/BibTeX markers in .txt/.csv exports.
+SNIFF_SIZE = 1 << 16
+
+
+def _iter_plain_text_dois(lines: Iterable[str]) -> Iterator[str]:
+    """Yields DOIs line by line; a DOI never spans a line break."""
+    for line in lines:
+        for match in re.findall(DOI_REGEX, line, re.IGNORECASE):
+            if cleaned := clean_doi(match):
+                yield cleaned
+
+
+def iter_dois_from_file(filepath: str) -> Iterator[str]:
     """
-    Reads a file and extracts DOIs based on its content and extension.
-    Supports .bib, .ris, .xml, .enw, .txt, .csv, and .json.
+    Yields the DOIs found in a file, possibly with duplicates.
+    Structured formats need the whole document; plain text is streamed line by
+    line so large lists are never held in memory at once.
     """
     p = Path(filepath)
     if not p.exists():
         raise FileNotFoundError(f"File not found: {filepath}")
 
-    text = p.read_text(encoding="utf-8", errors="ignore")
     ext = p.suffix.lower()
+    if ext in PARSER_MAP:
+        yield from PARSER_MAP[ext](p.read_text(encoding="utf-8", errors="ignore"))
+        return
+
+    with open(p, encoding="utf-8", errors="ignore", buffering=SNIFF_SIZE) as f:
+        if ext in (".txt", ".csv"):
+            head = f.read(SNIFF_SIZE)
+            parser = _detect_parser_from_content(head)
+            if parser is not _parse_plain_text:
+                yield from parser(head + f.read())
+                return
+            # Finish the possibly truncated last line of the sniffed block.
+            head += f.readline()
+            yield from _iter_plain_text_dois(head.splitlines())
+        yield from _iter_plain_text_dois(f)
+
 
-    parser_map = {
-        ".bib": _parse_bibtex,
-        ".ris": _parse_ris,
-        ".xml": _parse_endnote_xml,
-        ".enw": _parse_endnote_xml,
-        ".json": _parse_json,
-    }
-
-    if ext in parser_map:
-        dois = parser_map[ext](text)
-    elif ext in [".txt", ".csv"]:
-        parser = _detect_parser_from_content(text)
-        dois = parser(text)
-    else:
-        dois = _parse_plain_text(text)
-
-    return sorted(list(set(dois)))
+def extract_dois_from_file(filepath: str) -> list[str]:
+    """
+    Reads a file and extracts DOIs based on its content and extension.
+    Supports .bib, .ris, .xml, .enw, .txt, .csv, and .json.
+    """
+    return sorted(set(iter_dois_from_file(filepath)))
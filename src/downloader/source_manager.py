@@ -1,8 +1,13 @@
+import logging
+import sqlite3
+import threading
+from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any
 
 import requests
 
+from .metadata_cache import MetadataCache
 from .sources import (
     ArxivSource,
     CoreApiSource,
@@ -18,8 +23,20 @@ from .sources import (
     ZenodoSource,
 )
 
+log = logging.getLogger(__name__)
+
 
 class SourceManager:
+    # DOI registrant prefixes owned by a single repository. Those sources are
+    # tried first; the rest of the pipeline stays as the fallback.
+    DOI_PREFIX_ROUTES: dict[str, tuple[str, ...]] = {
+        "10.48550": ("arxiv_source",),
+        "10.5281": ("zenodo_source",),
+        "10.17605": ("osf_source",),
+        "10.31219": ("osf_source",),
+        "10.1371": ("pubmed_central_source", "doaj_source"),
+    }
+
     def __init__(self, session: requests.Session, email: str, core_api_key: str | None):
         self.session = session
         self.email = email
@@ -65,10 +82,73 @@ class SourceManager:
             self.doi_resolver_source,
         ]
 
+        self.sources_by_name: dict[str, Source] = {
+            s.name: s for s in self.metadata_sources + self.pipeline
+        }
+
+        self._prefix_routes: dict[str, list[Source]] = {
+            prefix: [getattr(self, attr) for attr in attrs]
+            for prefix, attrs in self.DOI_PREFIX_ROUTES.items()
+        }
+        # [wins, tries] of download attempts per DOI prefix and source name.
+        self._prefix_stats: defaultdict[str, dict[str, list[int]]] = defaultdict(dict)
+        self._stats_lock = threading.Lock()
+        self._stats_store: MetadataCache | None = None
+
+    def clear_metadata_caches(self) -> None:
+        for source in self.sources_by_name.values():
+            source.clear_metadata_cache()
+
+    def use_stats_store(self, store: MetadataCache) -> None:
+        """Loads outcomes recorded by earlier runs and persists new ones to `store`."""
+        rows = store.source_stats()
+        with self._stats_lock:
+            for prefix, source_name, wins, tries in rows:
+                self._prefix_stats[prefix][source_name] = [wins, tries]
+            self._stats_store = store
+
+    @staticmethod
+    def _hit_rate(entry: list[int] | None) -> float:
+        # Hit rate with one pseudo-win and one pseudo-failure (Laplace), so an
+        # untried source scores 0.5: it is tried after sources that mostly
+        # succeed and before ones that mostly fail. A single result moves a
+        # source less than a long record does.
+        wins, tries = entry or (0, 0)
+        return (wins + 1) / (tries + 2)
+
+    def pipeline_for(self, doi: str) -> list[Source]:
+        """
+        Returns the download pipeline ordered for this DOI: sources routed by
+        prefix first, then the others by their hit rate for the prefix (ties keep
+        the static order). The DOI resolver is the generic fallback and always
+        comes last.
+        """
+        prefix = doi.split("/", 1)[0]
+        routed = self._prefix_routes.get(prefix, [])
+        fallback = self.doi_resolver_source
+        rest = [s for s in self.pipeline if s not in routed and s is not fallback]
+        with self._stats_lock:
+            stats = self._prefix_stats.get(prefix)
+            if stats:
+                rest.sort(key=lambda s: -self._hit_rate(stats.get(s.name)))
+        return routed + rest + [fallback]
+
+    def record_attempt(self, doi: str, source_name: str, success: bool) -> None:
+        prefix = doi.split("/", 1)[0]
+        with self._stats_lock:
+            entry = self._prefix_stats[prefix].setdefault(source_name, [0, 0])
+            entry[0] += int(success)
+            entry[1] += 1
+            store = self._stats_store
+        if store:
+            try:
+                store.record_source_attempt(prefix, source_name, success)
+            except sqlite3.Error as e:
+                log.debug(f"Could not persist source stats: {e}")
+
     def test_connections(self) -> list[dict[str, Any]]:
         results = []
-        all_sources_dict = {s.name: s for s in self.metadata_sources + self.pipeline}
-        all_sources = list(all_sources_dict.values())
+        all_sources = list(self.sources_by_name.values())
 
         with ThreadPoolExecutor(max_workers=len(all_sources)) as executor:
             future_map = {executor.submit(s.test_connection): s for s in all_sources}
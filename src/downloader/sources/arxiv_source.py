@@ -1,10 +1,14 @@
 import logging
 import re
+from functools import lru_cache
 from typing import Any
+from urllib.parse import urljoin
 from xml.etree.ElementTree import Element
 
 import defusedxml.ElementTree as ET
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from src.downloader import config
 
@@ -12,73 +16,150 @@ from .base import Source
 
 log = logging.getLogger(__name__)
 
+# Clark-notation Atom tags, so lookups skip the prefix -> namespace expansion.
+_NS = "{http://www.w3.org/2005/Atom}"
+_ENTRY = _NS + "entry"
+_ID = _NS + "id"
+_TITLE = _NS + "title"
+_PUBLISHED = _NS + "published"
+_AUTHOR = _NS + "author"
+_NAME = _NS + "name"
+
+ARXIV_DOI_REGEX = re.compile(r"10\.48550/arXiv\.(\d+\.\d+v?\d*)", re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
+def _extract_arxiv_id(doi: str) -> str | None:
+    # Cheap prefix check first: almost every DOI we see is not an arXiv one.
+    if "10.48550/" not in doi:
+        return None
+    if m := ARXIV_DOI_REGEX.search(doi):
+        return m.group(1)
+    return None
+
+
 class ArxivSource(Source):
-    ARXIV_DOI_REGEX = r"10\.48550/arXiv\.(\d+\.\d+v?\d*)"
-    ATOM_NS = {"atom": "http://www.w3.org/2005/Atom"}
+    BATCH_SIZE = 100  # ids per id_list query
 
     def __init__(self, session: requests.Session):
         super().__init__(session)
         self.api_url = config.ARXIV_API_URL
 
+        # Dedicated keep-alive pool for the arXiv API. Mounting on the API
+        # prefix leaves the adapters used by the other sources untouched; a
+        # reused session keeps the pool it already has.
+        api_prefix = urljoin(self.api_url, "/")
+        if api_prefix not in self.session.adapters:
+            retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+            self.session.mount(
+                api_prefix,
+                HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retries),
+            )
+
     def _get_arxiv_id(self, doi: str) -> str | None:
-        if m := re.search(self.ARXIV_DOI_REGEX, doi, flags=re.IGNORECASE):
-            return m.group(1)
-        return None
+        # Memoised: get_metadata and download both ask for the same DOI.
+        return _extract_arxiv_id(doi)
 
-    def _extract_authors(self, entry: Element) -> list[str]:
+    def _parse_entry(self, entry: Element, doi: str) -> dict[str, Any] | None:
+        # Single pass over the entry's children instead of one find() per field.
+        published_text = title_text = None
         authors = []
-        for author_elem in entry.findall('atom:author', self.ATOM_NS):
-            name_elem = author_elem.find('atom:name', self.ATOM_NS)
-            if name_elem is not None and name_elem.text is not None:
-                authors.append(name_elem.text)
-        return authors
-
-    def _extract_basic_info(self, entry: Element) -> tuple[str, str] | None:
-        published_elem = entry.find("atom:published", self.ATOM_NS)
-        title_elem = entry.find("atom:title", self.ATOM_NS)
-        if published_elem is None or title_elem is None:
-            return None
-        
-        published_text = published_elem.text
-        title_text = title_elem.text
+        for child in entry:
+            tag = child.tag
+            if tag == _AUTHOR:
+                name = child.findtext(_NAME)
+                if name is not None:
+                    authors.append(name)
+            elif tag == _TITLE:
+                title_text = child.text
+            elif tag == _PUBLISHED:
+                published_text = child.text
         if published_text is None or title_text is None:
             return None
-            
-        return published_text, title_text
 
-    def _parse_metadata_from_xml(self, xml_text: str, doi: str) -> dict[str, Any] | None:
+        return {
+            "year": published_text.split("-")[0],
+            "title": title_text.strip().replace("\n", " "),
+            "authors": authors,
+            "doi": doi
+        }
+
+    def _parse_metadata_from_xml(self, xml_content: bytes, doi: str) -> dict[str, Any] | None:
         try:
-            root = ET.fromstring(xml_text)
-            entry = root.find("atom:entry", self.ATOM_NS)
+            root = ET.fromstring(xml_content)
+            entry = root.find(_ENTRY)
             if entry is None:
                 return None
-            
-            basic_info = self._extract_basic_info(entry)
-            if not basic_info:
-                return None
-            published_text, title_text = basic_info
-            
-            authors = self._extract_authors(entry)
-            
-            return {
-                "year": published_text.split("-")[0],
-                "title": title_text.strip().replace("\n", " "),
-                "authors": authors,
-                "doi": doi
-            }
+            return self._parse_entry(entry, doi)
         except Exception as e:
             log.error(f"[{self.name}] XML parsing failed for {doi}: {e}", exc_info=True)
             return None
 
+    def _fetch_batch(self, ids: dict[str, str]) -> dict[str, dict[str, Any] | None]:
+        """
+        Fetches one id_list query. `ids` maps arXiv id -> DOI. A failed query
+        returns nothing, so those DOIs fall back to single-id lookups; None is
+        only returned for DOIs a successful feed did not contain.
+        """
+        resp = self._make_request(
+            config.ARXIV_API_URL,
+            params={"id_list": ",".join(ids), "max_results": len(ids)},
+            timeout=10,
+        )
+        if not resp:
+            return {}
+        try:
+            root = ET.fromstring(resp.content)
+        except Exception as e:
+            log.error(f"[{self.name}] XML parsing failed for batch: {e}", exc_info=True)
+            return {}
+
+        results: dict[str, dict[str, Any] | None] = dict.fromkeys(ids.values())
+
+        for entry in root.findall(_ENTRY):
+            # Entry ids look like http://arxiv.org/abs/2101.00001v2
+            entry_id = entry.findtext(_ID, "").rsplit("/abs/", 1)[-1]
+            doi = ids.get(entry_id) or ids.get(entry_id.split("v")[0])
+            if doi:
+                results[doi] = self._parse_entry(entry, doi)
+        return results
+
+    def get_metadata_batch(self, dois: list[str]) -> dict[str, dict[str, Any] | None]:
+        """
+        Fetches metadata for many arXiv DOIs using one API call per BATCH_SIZE ids.
+        Results go into the metadata memo, so later get_metadata calls for these
+        DOIs are free. Only memoized DOIs are skipped; earlier misses are asked again.
+        """
+        results: dict[str, dict[str, Any] | None] = {}
+        pending: dict[str, str] = {}
+        for doi in dois:
+            results[doi] = self._memo_get(doi)
+            if results[doi] is not None:
+                continue
+            if arxiv_id := self._get_arxiv_id(doi):
+                pending.setdefault(arxiv_id, doi)
+
+        items = list(pending.items())
+        for start in range(0, len(items), self.BATCH_SIZE):
+            for doi, metadata in self._fetch_batch(dict(items[start:start + self.BATCH_SIZE])).items():
+                if metadata is not None:
+                    self._memo_put(doi, metadata)
+                    results[doi] = metadata
+
+        return results
+
     def get_metadata(self, doi: str) -> dict[str, Any] | None:
+        return self._memoized_metadata(doi, self._fetch_metadata)
+
+    def _fetch_metadata(self, doi: str) -> dict[str, Any] | None:
         arxiv_id = self._get_arxiv_id(doi)
         if not arxiv_id: return None
         try:
             url = f"{config.ARXIV_API_URL}?id_list={arxiv_id}"
             resp = self._make_request(url, timeout=10)
             if not resp: return None
-            
-            return self._parse_metadata_from_xml(resp.text, doi)
+
+            return self._parse_metadata_from_xml(resp.content, doi)
         except Exception as e:
             log.error(f"[{self.name}] Metadata request failed for {doi}: {e}", exc_info=True)
             return None
@@ -86,5 +167,5 @@ class ArxivSource(Source):
     def download(self, doi: str, filepath, metadata: dict[str, Any]) -> bool:
         arxiv_id = self._get_arxiv_id(doi)
         if arxiv_id:
-            return self._fetch_and_save(config.ARXIV_PDF_URL.format(arxiv_id=arxiv_id), filepath)
+            return self._fetch_and_save(config.ARXIV_PDF(arxiv_id), filepath)
         return False
\ No newline at end of file
@@ -2,6 +2,8 @@ import logging
 import threading
 import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 from urllib.parse import urljoin
@@ -12,6 +14,17 @@ from ..utils import find_pdf_link_on_page
 
 log = logging.getLogger(__name__)
 
+# TLS bodies can't be spliced to disk with sendfile, so keep the Python copy
+# loop but with chunks large enough that per-chunk overhead is negligible.
+WRITE_CHUNK_SIZE = 1 << 16
+# Chunks collect in memory and reach the disk in 1 MiB writes, so a typical
+# PDF is written with a handful of syscalls.
+WRITE_BUFFER_SIZE = 1 << 20
+MIN_PDF_SIZE = 5000  # bytes; anything smaller is an error page or stub
+# Memoized lookups per source; a DOI's lookup is reused within one download,
+# so only the most recent ones need to stay.
+METADATA_MEMO_SIZE = 1024
+
 class Source(ABC):
     """Abstract base class for a PDF source."""
 
@@ -21,23 +34,96 @@ class Source(ABC):
         self._last_request_time = 0.0
         self._min_request_interval = 2.0
         self._lock = threading.Lock()
+        self._metadata_cache: dict[str, dict[str, Any] | None] = {}
+        self._metadata_memo: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._memo_lock = threading.Lock()
+        # Per-thread record of how this thread's requests went, for lookup_metadata,
+        # and of the links download_avoiding() must not fetch again.
+        self._lookup = threading.local()
 
     @abstractmethod
     def download(self, doi: str, filepath: Path, metadata: dict[str, Any]) -> bool:
         pass
 
+    def download_avoiding(
+        self, doi: str, filepath: Path, metadata: dict[str, Any], dead_urls: set[str]
+    ) -> bool:
+        """
+        Runs download() without fetching any of `dead_urls` again, so a source
+        whose own link already failed can still try its other routes.
+        """
+        self._lookup.dead_urls = dead_urls
+        try:
+            return self.download(doi, filepath, metadata)
+        finally:
+            self._lookup.dead_urls = ()
+
     def get_metadata(self, doi: str) -> dict[str, Any] | None:
         """
         Retrieves metadata for a DOI. Subclasses can override with caching.
         """
         return None
 
+    def lookup_metadata(self, doi: str) -> tuple[dict[str, Any] | None, bool]:
+        """
+        Runs get_metadata and also reports whether the answer is definitive:
+        True for metadata, or for None when the API answered (200 or 404);
+        False when a request failed or none was made.
+        """
+        self._lookup.answered = False
+        self._lookup.failed = False
+        metadata = self.get_metadata(doi)
+        if metadata is not None:
+            return metadata, True
+        return None, self._lookup.answered and not self._lookup.failed
+
+    def _memoized_metadata(
+        self, doi: str, fetch: Callable[[str], dict[str, Any] | None]
+    ) -> dict[str, Any] | None:
+        """
+        Runs `fetch` once per DOI, so download() falling back to get_metadata
+        reuses the lookup made during the metadata phase instead of a second request.
+        Misses are not kept: a later call may succeed where this one failed.
+        Only the METADATA_MEMO_SIZE most recently used results are kept.
+        """
+        memoized = self._memo_get(doi)
+        if memoized is not None:
+            return memoized
+        result = fetch(doi)
+        if result is not None:
+            self._memo_put(doi, result)
+        return result
+
+    def _memo_get(self, doi: str) -> dict[str, Any] | None:
+        with self._memo_lock:
+            if doi in self._metadata_memo:
+                self._metadata_memo.move_to_end(doi)
+                return self._metadata_memo[doi]
+        return None
+
+    def _memo_put(self, doi: str, metadata: dict[str, Any]) -> None:
+        with self._memo_lock:
+            self._metadata_memo[doi] = metadata
+            self._metadata_memo.move_to_end(doi)
+            if len(self._metadata_memo) > METADATA_MEMO_SIZE:
+                self._metadata_memo.popitem(last=False)
+
+    def clear_metadata_cache(self) -> None:
+        """Forgets memoized lookups, e.g. before a long-lived Downloader's next run."""
+        self._metadata_cache.clear()
+        with self._memo_lock:
+            self._metadata_memo.clear()
+
     def test_connection(self) -> tuple[bool, str]:
         base_url = getattr(self, "api_url", None)
         if base_url:
             try:
                 domain = urljoin(base_url, "/")
-                r = self.session.get(domain, timeout=5)
+                # HEAD proves reachability without downloading the landing page;
+                # servers that reject the method get a plain GET instead.
+                r = self.session.head(domain, timeout=5, allow_redirects=True)
+                if r.status_code in (405, 501):
+                    r = self.session.get(domain, timeout=5)
                 r.raise_for_status()
                 return (True, "API is reachable")
             except Exception as e:
@@ -53,13 +139,13 @@ class Source(ABC):
             self._last_request_time = time.time()
 
     def _write_chunks(self, resp: requests.Response, filepath: Path) -> None:
-        with filepath.open("wb") as fh:
-            for chunk in resp.iter_content(chunk_size=8192):
+        with filepath.open("wb", buffering=WRITE_BUFFER_SIZE) as fh:
+            for chunk in resp.iter_content(chunk_size=WRITE_CHUNK_SIZE):
                 fh.write(chunk)
 
     def _validate_downloaded_file(self, filepath: Path, content_length: str | None) -> bool:
         file_size = filepath.stat().st_size
-        if file_size < 5000:
+        if file_size < MIN_PDF_SIZE:
             log.warning(f"[{self.name}] File too small ({file_size} bytes).")
             return False
         
@@ -91,6 +177,10 @@ class Source(ABC):
         if "application/pdf" not in content_type:
             log.warning(f"[{self.name}] Content-Type is not PDF ({content_type})")
             return False
+        # The headers already rule out stubs; don't stream a body we'd discard.
+        if content_length and content_length.isdigit() and int(content_length) < MIN_PDF_SIZE:
+            log.warning(f"[{self.name}] File too small ({content_length} bytes).")
+            return False
 
         try:
             self._write_chunks(resp, tmp_path)
@@ -131,6 +221,9 @@ class Source(ABC):
         return False
 
     def _fetch_and_save(self, url: str, filepath: Path, headers: dict[str, str] | None = None, max_retries: int = 3) -> bool:
+        if url in getattr(self._lookup, "dead_urls", ()):
+            log.debug(f"[{self.name}] Skipping link that already failed: {url}")
+            return False
         for attempt in range(max_retries):
             try:
                 self._rate_limit()
@@ -161,7 +254,7 @@ class Source(ABC):
         return False
 
     def _make_request(self, url: str, method: str = "GET", **kwargs) -> requests.Response | None:
-        log.debug(f"[{self.name}] Making request: {method} {url} {kwargs}")
+        log.debug("[%s] Making request: %s %s %s", self.name, method, url, kwargs)
         try:
             self._rate_limit()
             if "headers" in kwargs:
@@ -171,7 +264,15 @@ class Source(ABC):
             
             response = self.session.request(method, url, **kwargs)
             response.raise_for_status()
+            self._lookup.answered = True
             return response
         except Exception as e:
             log.debug(f"[{self.name}] Request failed for {url}: {e}")
+            # A 404 is the API saying "no such record"; anything else
+            # (timeouts, 429, 5xx) says nothing about the DOI.
+            if isinstance(e, requests.HTTPError) and e.response is not None \
+                    and e.response.status_code == 404:
+                self._lookup.answered = True
+            else:
+                self._lookup.failed = True
             return None
@@ -19,7 +19,7 @@ class CoreApiSource(Source):
     def _get_data(self, doi: str):
         if not self.api_key: return None
         try:
-            url = self.api_url.format(doi=quote_plus(doi))
+            url = config.CORE_URL(quote_plus(doi))
             headers = {"Authorization": f"Bearer {self.api_key}"}
             resp = self._make_request(url, headers=headers, timeout=10)
             if resp and resp.status_code == 200: return resp.json()
@@ -28,6 +28,9 @@ class CoreApiSource(Source):
         return None
 
     def get_metadata(self, doi: str) -> dict[str, Any] | None:
+        return self._memoized_metadata(doi, self._fetch_metadata)
+
+    def _fetch_metadata(self, doi: str) -> dict[str, Any] | None:
         data = self._get_data(doi)
         if not data: return None
         return {
@@ -41,8 +44,8 @@ class CoreApiSource(Source):
     def download(self, doi: str, filepath, metadata: dict[str, Any]) -> bool:
         pdf_url = metadata.get("_pdf_url")
         if not pdf_url:
-            data = self._get_data(doi)
-            pdf_url = data.get("fullTextLink") if data else None
+            meta = self.get_metadata(doi)
+            pdf_url = meta.get("_pdf_url") if meta else None
         if pdf_url and ("pdf" in pdf_url.lower()):
             return self._fetch_and_save(pdf_url, filepath)
         return False
\ No newline at end of file
@@ -93,14 +93,15 @@ class CrossrefSource(Source):
                 return None
 
             data = response.json()
-            log.debug(f"[{self.name}] Full response for {doi}: {data}")
+            # %-style so the (large) response is only repr'd when DEBUG is on.
+            log.debug("[%s] Full response for %s: %s", self.name, doi, data)
             if data.get("status") != "ok":
                 log.debug(f"[{self.name}] No results found for DOI: {doi}")
                 self._metadata_cache[doi] = None
                 return None
 
             message = data.get("message", {})
-            log.debug(f"[{self.name}] Message for {doi}: {message}")
+            log.debug("[%s] Message for %s: %s", self.name, doi, message)
 
             result = self._parse_metadata(message)
             result["doi"] = doi
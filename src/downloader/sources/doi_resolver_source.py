@@ -17,7 +17,7 @@ class DoiResolverSource(Source):
 
     def download(self, doi: str, filepath, metadata: dict[str, Any]) -> bool:
         try:
-            url = self.api_url.format(doi=quote_plus(doi))
+            url = config.DOI_RESOLVER(quote_plus(doi))
             # Try to negotiate for PDF content
             headers = {"Accept": "application/pdf"}
             # We use _make_request to get the response but need stream=True which _make_request doesn't default to
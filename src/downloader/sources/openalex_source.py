@@ -27,7 +27,7 @@ class OpenAlexSource(Source):
             return self._metadata_cache[doi]
         
         try:
-            url = config.OPENALEX_API_URL.format(doi=quote_plus(doi))
+            url = config.OPENALEX_URL(quote_plus(doi))
             resp = self._make_request(url, timeout=10)
             if not resp:
                 self._metadata_cache[doi] = None
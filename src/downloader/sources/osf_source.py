@@ -92,6 +92,9 @@ class OSFSource(Source):
         }
 
     def get_metadata(self, doi: str) -> dict[str, Any] | None:
+        return self._memoized_metadata(doi, self._fetch_metadata)
+
+    def _fetch_metadata(self, doi: str) -> dict[str, Any] | None:
         """
         Gets the metadata for a given DOI from the OSF API.
         """
@@ -16,8 +16,11 @@ class SemanticScholarSource(Source):
         self.api_url = config.SEMANTIC_SCHOLAR_API_URL
 
     def get_metadata(self, doi: str) -> dict[str, Any] | None:
+        return self._memoized_metadata(doi, self._fetch_metadata)
+
+    def _fetch_metadata(self, doi: str) -> dict[str, Any] | None:
         try:
-            url = config.SEMANTIC_SCHOLAR_API_URL.format(doi=quote_plus(doi))
+            url = config.SEMANTIC_SCHOLAR_URL(quote_plus(doi))
             resp = self._make_request(url, timeout=10)
             if not resp or resp.status_code != 200: return None
             data = resp.json()
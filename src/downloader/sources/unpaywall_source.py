@@ -17,11 +17,14 @@ class UnpaywallSource(Source):
         self.api_url = config.UNPAYWALL_API_URL
 
     def get_metadata(self, doi: str) -> dict[str, Any] | None:
+        return self._memoized_metadata(doi, self._fetch_metadata)
+
+    def _fetch_metadata(self, doi: str) -> dict[str, Any] | None:
         if not self.email:
             log.warning(f"[{self.name}] Email not configured, skipping Unpaywall.")
             return None
         try:
-            url = config.UNPAYWALL_API_URL.format(doi=quote_plus(doi))
+            url = config.UNPAYWALL_URL(quote_plus(doi))
             response = self._make_request(url, params={"email": self.email}, timeout=10)
             if not response: return None
             data = response.json()
@@ -26,6 +26,9 @@ class ZenodoSource(Source):
         self.api_url = config.ZENODO_API_URL
 
     def get_metadata(self, doi: str) -> dict[str, Any] | None:
+        return self._memoized_metadata(doi, self._fetch_metadata)
+
+    def _fetch_metadata(self, doi: str) -> dict[str, Any] | None:
         """
         Gets the metadata for a given DOI from the Zenodo API.
         """
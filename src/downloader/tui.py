@@ -3,10 +3,12 @@ Open-Access PDF Retrieval System — TUI Elements
 """
 
 import logging
-import re
+import os
 import sys
+import time
 from collections import deque
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
 from pathlib import Path
 
 try:
@@ -18,16 +20,15 @@ from rich.align import Align
 from rich.console import Console, Group
 from rich.live import Live
 from rich.panel import Panel
-from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
 from rich.prompt import Prompt
 from rich.rule import Rule
-from rich.table import Table
+from rich.segment import Segments
 from rich.text import Text
 
-from . import settings_manager
+from . import config, settings_manager
 from .core import Downloader
-from .parsers import extract_dois_from_file
-from .utils import clean_doi
+from .parsers import iter_dois_from_file
+from .utils import DOI_SPLIT_REGEX, clean_doi, interleave_by_prefix
 
 console = Console()
 
@@ -55,12 +56,14 @@ def _get_key_unix():
     old = termios.tcgetattr(fd)
     try:
         tty.setraw(fd)
-        ch = sys.stdin.read(1)
+        # Read the fd directly: sys.stdin's buffer could swallow the rest of an
+        # escape sequence, and select() on the fd would then report nothing.
+        ch = os.read(fd, 1).decode(errors="ignore")
         if ch == "\x1b":
             import select
-            rlist, _, _ = select.select([sys.stdin], [], [], 0.1)
+            rlist, _, _ = select.select([fd], [], [], 0.05)
             if rlist:
-                seq = sys.stdin.read(2)
+                seq = os.read(fd, 2).decode(errors="ignore")
                 if seq == "[A":
                     return "UP"
                 if seq == "[B":
@@ -141,7 +144,7 @@ def _prompt_for_api_key(cfg):
     )
 
 def _prompt_for_workers(cfg):
-    default_workers = (cfg or {}).get("max_workers", 10)
+    default_workers = (cfg or {}).get("max_workers", config.DEFAULT_MAX_WORKERS)
     while True:
         raw = Prompt.ask(
             "⚙️ Parallel downloads", default=str(default_workers)
@@ -180,21 +183,20 @@ def get_settings(cfg):
 def _get_dois_from_file(file, settings):
     dois = set()
     try:
-        extracted = extract_dois_from_file(file)
-        dois.update(extracted)
+        dois.update(iter_dois_from_file(file))
         note(f"Found {len(dois)} unique DOIs in {Path(file).name}", settings or {})
-        return list(dois)
+        return dois
     except Exception as e:
         err(f"Error reading file: {e}", settings or {})
-        return []
+        return set()
 
 def _get_dois_manual():
     dois = set()
     raw = Prompt.ask("✍️ Enter DOIs (comma/space/newline)")
-    for token in re.split(r"[,\s\n]+", raw):
+    for token in DOI_SPLIT_REGEX.split(raw):
         if cleaned := clean_doi(token.strip()):
             dois.add(cleaned)
-    return list(dois)
+    return dois
 
 def get_dois(settings):
     phase("Input Source", settings or {})
@@ -212,32 +214,35 @@ def show_failed_dois(settings):
 
     output_dir = Path(settings["output_dir"])
     fp = output_dir / "failed_dois.txt"
-    if fp.exists() and fp.read_text():
+    text = fp.read_text() if fp.exists() else ""
+    if text:
         console.print(Rule("Failed DOIs"))
-        console.print(fp.read_text())
+        console.print(text)
     else:
         done("No failed DOIs list found.", {})
 
 
-def _setup_logging_for_download(settings):
+def _setup_logging_for_download(debug):
     logger = logging.getLogger()
     previous_level = logger.level
     previous_handlers = list(logger.handlers)
 
-    if not should_show_debug(settings):
+    if not debug:
         logger.setLevel(logging.CRITICAL)
         logging.getLogger("urllib3").setLevel(logging.CRITICAL)
         logging.getLogger("requests").setLevel(logging.CRITICAL)
     return logger, previous_level, previous_handlers
 
-def _restore_logging(logger, previous_level, previous_handlers, settings):
+def _restore_logging(logger, previous_level, previous_handlers, debug):
     logger.handlers = previous_handlers
     logger.setLevel(previous_level)
-    if not should_show_debug(settings):
+    if not debug:
         logging.getLogger("urllib3").setLevel(logging.WARNING)
         logging.getLogger("requests").setLevel(logging.WARNING)
 
 def _create_progress_bar(total):
+    from rich.progress import BarColumn, Progress, TextColumn
+
     progress = Progress(
         TextColumn("[cyan]{task.description}"),
         BarColumn(),
@@ -247,18 +252,17 @@ def _create_progress_bar(total):
     task = progress.add_task("Overall Progress", total=total)
     return progress, task
 
-def _generate_live_panel(progress, recent_logs, total_dois) -> Panel:
-    renderables = [progress]
-    if recent_logs:
-        renderables.insert(0, "\n".join(recent_logs))
-        renderables.insert(0, "")
+def _refresh_log_text(log_text: Text, recent_logs) -> None:
+    """Rewrites the live panel's log area in place from the recent log lines."""
+    log_text.plain = ""
+    for line in recent_logs:
+        log_text.append("\n")
+        log_text.append_text(line)
 
-    content = Group(*renderables)
-    return Panel(
-        content,
-        title=f"[bold cyan]Retrieving {total_dois} PDFs[/bold cyan]",
-        border_style="grey70",
-    )
+def _display_name(path: str) -> str:
+    # Plain string splitting; building a Path per result just to get .name is wasted work.
+    filename = path.rpartition("/")[2].rpartition("\\")[2]
+    return filename if len(filename) <= 75 else filename[:72] + "...pdf"
 
 def _process_download_result(future, future_map, results, recent_logs):
     log_message = ""
@@ -270,20 +274,10 @@ def _process_download_result(future, future_map, results, recent_logs):
 
         if status == "success":
             source = result.get("source", "Unknown")
-            filename = Path(result.get("filename", "")).name
-            display_name = (
-                filename
-                if len(filename) <= 75
-                else filename[:72] + "...pdf"
-            )
+            display_name = _display_name(result.get("filename", ""))
             log_message = f"✅ [green]Success ({source}):[/green] [dim]{display_name}[/dim]"
         elif status == "skipped":
-            filename = Path(result.get("filename", "")).name
-            display_name = (
-                filename
-                if len(filename) <= 75
-                else filename[:72] + "...pdf"
-            )
+            display_name = _display_name(result.get("filename", ""))
             log_message = f"⏩ [dim]Skipped (Exists):[/dim] [dim]{display_name}[/dim]"
         else:
             log_message = f"❌ [red]Failed:[/red] [dim]{doi}[/dim]"
@@ -295,9 +289,63 @@ def _process_download_result(future, future_map, results, recent_logs):
             f"💥 [bold red]CRITICAL ERROR:[/bold red] [dim]{doi}[/dim]"
         )
     
-    recent_logs.append(log_message)
+    recent_logs.append(Text.from_markup(log_message))
+
+PROGRESS_FLUSH_INTERVAL = 0.1  # seconds between pushes of coalesced completions
+
+class _WorkerTuner:
+    """
+    Adjusts the number of in-flight downloads between waves, starting at
+    MIN_WORKERS and never exceeding `ceiling` (the configured max_workers).
+    A wave ends once `limit` downloads have finished; its bytes/sec is compared
+    with the previous wave's. The limit grows by STEP while throughput improves.
+    The first drop steps it back and settles it there: growth stops, so noisy
+    waves can't swing it up and down, and further drops only lower it.
+    """
+
+    STEP = 4
+    MIN_WORKERS = 4
+    THRESHOLD = 0.05  # ignore throughput changes smaller than 5%
+
+    def __init__(self, ceiling: int):
+        self.ceiling = ceiling
+        self.floor = min(self.MIN_WORKERS, ceiling)
+        self.limit = self.floor
+        self._cap = ceiling  # lowered to the limit once throughput drops
+        self._last_rate: float | None = None
+        self._start_wave()
+
+    def _start_wave(self) -> None:
+        self._wave_start = time.monotonic()
+        self._wave_bytes = 0
+        self._wave_done = 0
+
+    def record(self, nbytes: int) -> None:
+        self._wave_bytes += nbytes
+        self._wave_done += 1
+        if self._wave_done < self.limit:
+            return
+
+        elapsed = max(time.monotonic() - self._wave_start, 1e-6)
+        rate = self._wave_bytes / elapsed
+        if self._last_rate is None or rate > self._last_rate * (1 + self.THRESHOLD):
+            self.limit = min(self.limit + self.STEP, self._cap)
+        elif rate < self._last_rate * (1 - self.THRESHOLD):
+            self.limit = self._cap = max(self.limit - self.STEP, self.floor)
+        self._last_rate = rate
+        self._start_wave()
+
+def _downloaded_bytes(result) -> int:
+    if result.get("status") != "success":
+        return 0
+    try:
+        return Path(result["filename"]).stat().st_size
+    except (KeyError, OSError):
+        return 0
 
 def _print_summary(stats):
+    from rich.table import Table
+
     tbl = Table(title="[bold]Download Summary[/bold]", show_header=False, box=None)
     tbl.add_column("Metric", style="cyan")
     tbl.add_column("Value", style="bold", justify="right")
@@ -314,55 +362,123 @@ def _save_failed_dois(results, output_dir):
         out_path = Path(output_dir)
         out_path.mkdir(parents=True, exist_ok=True)
         fp = out_path / "failed_dois.txt"
-        fp.write_text("\n".join(sorted(failed)))
+        with fp.open("w", encoding="utf-8", buffering=1 << 16) as f:
+            f.writelines(f"{doi}\n" for doi in sorted(failed))
         console.print(
             f" ⚠️ [yellow]{len(failed)} DOIs failed — see 'failed_dois.txt' in the output folder.[/yellow]"
         )
 
-def run_download(settings, dois):
-    dl = Downloader(
+def _create_downloader(settings):
+    return Downloader(
         output_dir=settings["output_dir"],
         email=settings["email"],
         core_api_key=settings.get("core_api_key"),
         verify_ssl=settings["verify_ssl"],
+        max_workers=settings["max_workers"],
     )
 
+def run_download(settings, dois, dl=None):
+    """Downloads `dois`. Pass `dl` to reuse a Downloader and its warm HTTP session."""
+    if dl is None:
+        dl = _create_downloader(settings)
+        try:
+            return run_download(settings, dois, dl)
+        finally:
+            dl.close()
+    dl.reset_stats()
+
     results = []
     recent_logs = deque(maxlen=5)
     progress, progress_task = _create_progress_bar(len(dois))
 
-    logger, prev_level, prev_handlers = _setup_logging_for_download(settings)
+    debug = should_show_debug(settings)
+    logger, prev_level, prev_handlers = _setup_logging_for_download(debug)
+
+    # Built once; completions only mutate log_text and the progress bar.
+    log_text = Text()
+    panel = Panel(
+        Group(log_text, progress),
+        title=f"[bold cyan]Retrieving {len(dois)} PDFs[/bold cyan]",
+        border_style="grey70",
+    )
 
     try:
         with Live(
-            _generate_live_panel(progress, recent_logs, len(dois)),
+            panel,
             console=console,
             screen=False,
-            refresh_per_second=10,
+            refresh_per_second=4,  # faster redraws are not perceptible
             transient=True,
-        ) as live:
-            with ThreadPoolExecutor(max_workers=settings["max_workers"]) as ex:
-                future_map = {ex.submit(dl.download_one, doi): doi for doi in dois}
-
-                for f in as_completed(future_map):
-                    _process_download_result(f, future_map, results, recent_logs)
-                    progress.update(progress_task, advance=1)
-                    live.update(_generate_live_panel(progress, recent_logs, len(dois)))
+        ):
+            dl.prefetch_metadata(dois)
+            # The pool (and the Downloader's connection pool) is sized for the
+            # configured max_workers; the tuner decides how many downloads are
+            # actually in flight below it. Threads are only spawned on demand.
+            tuner = _WorkerTuner(settings["max_workers"])
+            # Sorted input groups DOIs by publisher; spread them out instead.
+            pending = iter(interleave_by_prefix(dois))
+            future_map = {}
+            # Completions are coalesced and pushed to the panel at most every
+            # PROGRESS_FLUSH_INTERVAL, so a burst of fast results costs one update.
+            unflushed = 0
+            last_flush = time.monotonic()
+            with ThreadPoolExecutor(max_workers=tuner.ceiling) as ex:
+                while True:
+                    while len(future_map) < tuner.limit and (doi := next(pending, None)) is not None:
+                        future_map[ex.submit(dl.download_one, doi)] = doi
+                    if not future_map:
+                        break
+
+                    done, _ = wait(
+                        future_map,
+                        timeout=PROGRESS_FLUSH_INTERVAL if unflushed else None,
+                        return_when=FIRST_COMPLETED,
+                    )
+                    for f in done:
+                        _process_download_result(f, future_map, results, recent_logs)
+                        del future_map[f]
+                        tuner.record(_downloaded_bytes(results[-1]))
+                        unflushed += 1
+
+                    now = time.monotonic()
+                    if unflushed and now - last_flush >= PROGRESS_FLUSH_INTERVAL:
+                        progress.update(progress_task, advance=unflushed)
+                        _refresh_log_text(log_text, recent_logs)
+                        unflushed = 0
+                        last_flush = now
+
+            if unflushed:
+                progress.update(progress_task, advance=unflushed)
+                _refresh_log_text(log_text, recent_logs)
     finally:
-        _restore_logging(logger, prev_level, prev_handlers, settings)
+        _restore_logging(logger, prev_level, prev_handlers, debug)
 
     _print_summary(dl.stats)
     _save_failed_dois(results, settings["output_dir"])
 
-def run_status_test(settings):
+def run_status_test(settings, dl=None):
     """Initializes sources and tests their connections."""
+    if dl is None:
+        try:
+            dl = _create_downloader(settings)
+        except Exception as e:
+            err(f"Failed to initialize downloader: {e}", settings or {})
+            return
+        try:
+            return run_status_test(settings, dl)
+        finally:
+            dl.close()
+
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich.table import Table
 
     phase("Source Connection Status", settings or {})
 
     logger = logging.getLogger()
     current_level = logger.level
+    debug = should_show_debug(settings)
 
-    if not should_show_debug(settings):
+    if not debug:
         logger.setLevel(logging.CRITICAL)
         logging.getLogger("urllib3").setLevel(logging.CRITICAL)
         logging.getLogger("requests").setLevel(logging.CRITICAL)
@@ -381,13 +497,6 @@ def run_status_test(settings):
         task = progress.add_task("Testing sources...", total=1)
 
         try:
-            dl = Downloader(
-                output_dir=settings["output_dir"],
-                email=settings["email"],
-                core_api_key=settings.get("core_api_key"),
-                verify_ssl=settings["verify_ssl"],
-            )
-
             all_sources = {
                 s.name: s
                 for s in dl.metadata_sources + dl.pipeline + [dl.unpaywall_source]
@@ -409,42 +518,52 @@ def run_status_test(settings):
     console.print(tbl)
 
     logger.setLevel(current_level)
-    if not should_show_debug(settings):
+    if not debug:
         logging.getLogger("urllib3").setLevel(logging.WARNING)
         logging.getLogger("requests").setLevel(logging.WARNING)
 
-def _render_main_menu(current, options, settings, dois):
-    terminal_width = console.size.width
+MENU_OPTIONS = [
+    ("1", "Configure Settings"),
+    ("2", "Input DOIs"),
+    ("3", "Begin Download"),
+    ("4", "View Failed List"),
+    ("5", "Open Output Folder"),
+    ("6", "Test System Status"),
+    ("7", "Clear Settings"),
+    ("8", "Quit"),
+]
+
+# Menu markup is fixed, so build both variants of every line once; a keypress
+# only swaps which line uses the selected variant.
+_OPT_NORMAL = [f"[bold]{key}.[/bold] {label}" for key, label in MENU_OPTIONS]
+_OPT_SELECTED = [
+    f"[reverse][bold blue]{key}. {label}[/bold blue][/reverse]" for key, label in MENU_OPTIONS
+]
+_WELCOME_MESSAGE = Align.center(
+    "\n[bold white]Welcome to the PDF Downloader CLI[/bold white]\n\n"
+)
+_MENU_HEADER = Align.left(Text("[ MENU ]", style="bold cyan"))
+_MENU_TITLE = "[bold cyan]Open-Access PDF Retrieval System[/bold cyan]"
+
+def _render_main_menu(current, configured, doi_count, terminal_width):
+    status_s = "[green]Configured[/green]" if configured else "[dim]Not Set[/dim]"
+    status_d = f"[green]{doi_count}[/green]" if doi_count else "[dim]0[/dim]"
 
-    status_s = "[green]Configured[/green]" if settings else "[dim]Not Set[/dim]"
-    status_d = f"[green]{len(dois)}[/green]" if dois else "[dim]0[/dim]"
-
-    welcome_message = Align.center(
-        "\n[bold white]Welcome to the PDF Downloader CLI[/bold white]\n\n"
-    )
     status_line = Align.center(
         f"[dim]Settings:[/dim] {status_s} | [dim]DOIs Loaded:[/dim] {status_d}\n"
     )
-    menu_header = Text("[ MENU ]", style="bold cyan")
 
     separator = "[dim]" + "─" * min(40, terminal_width - 10) + "[/dim]"
 
-    lines = []
-    for i, (key, label) in enumerate(options):
-        if i == current:
-            lines.append(
-                f"[reverse][bold blue]{key}. {label}[/bold blue][/reverse]"
-            )
-        else:
-            lines.append(f"[bold]{key}.[/bold] {label}")
-        if i == 2:
-            lines.append(separator)
+    lines = _OPT_NORMAL[:]
+    lines[current] = _OPT_SELECTED[current]
+    lines.insert(3, separator)
 
     menu_block = "\n".join(lines)
     panel_content = Group(
-        welcome_message,
+        _WELCOME_MESSAGE,
         status_line,
-        Align.left(menu_header),
+        _MENU_HEADER,
         Align.left(menu_block),
         Text(""),
     )
@@ -453,12 +572,27 @@ def _render_main_menu(current, options, settings, dois):
 
     return Panel(
         panel_content,
-        title="[bold cyan]Open-Access PDF Retrieval System[/bold cyan]",
+        title=_MENU_TITLE,
         title_align="center",
         border_style="grey70",
         padding=padding,
     )
 
+@lru_cache(maxsize=32)
+def _menu_segments(current, configured, doi_count, terminal_width):
+    """
+    Lays the menu panel out once per distinct state and caches the resulting
+    segments; Live then only has to write them out on a redraw.
+    """
+    panel = _render_main_menu(current, configured, doi_count, terminal_width)
+    lines = console.render_lines(
+        panel, console.options.update_width(terminal_width), new_lines=True
+    )
+    return Segments([segment for line in lines for segment in line])
+
+def _main_menu(current, settings, dois):
+    return _menu_segments(current, bool(settings), len(dois or ()), console.size.width)
+
 def _handle_menu_input(k, current, options):
     if k in ("\x1b[A", "H", "UP"):
         return (current - 1) % len(options), None
@@ -473,45 +607,29 @@ def _handle_menu_input(k, current, options):
     return current, None
 
 def show_main_panel(settings, dois):
-    force_refresh = False
-
-    def handle_resize(signum, frame):
-        nonlocal force_refresh
-        force_refresh = True
-
-    try:
-        import signal
-        signal.signal(signal.SIGWINCH, handle_resize)
-    except (AttributeError, ImportError):
-        pass
-
-    options = [
-        ("1", "Configure Settings"),
-        ("2", "Input DOIs"),
-        ("3", "Begin Download"),
-        ("4", "View Failed List"),
-        ("5", "Open Output Folder"),
-        ("6", "Test System Status"),
-        ("7", "Clear Settings"),
-        ("8", "Quit"),
-    ]
-
     current = 0
 
     console.clear()
     console.print("")
 
-    with Live(_render_main_menu(current, options, settings, dois), console=console, refresh_per_second=30, screen=False) as live:
+    # Nothing changes between keypresses, so redraw only when the selection moves
+    # instead of letting Live repaint the panel on a timer.
+    with Live(
+        _main_menu(current, settings, dois),
+        console=console,
+        auto_refresh=False,
+        screen=False,
+    ) as live:
+        size = console.size
         while True:
-            if force_refresh:
-                force_refresh = False
-                live.update(_render_main_menu(current, options, settings, dois))
-                continue
-
             k = get_single_key()
-            current, selection = _handle_menu_input(k, current, options)
+            previous = current
+            current, selection = _handle_menu_input(k, current, MENU_OPTIONS)
             
             if selection:
                 return selection
 
-            live.update(_render_main_menu(current, options, settings, dois))
+            # The layout depends on the terminal width, so a resize also redraws.
+            if current != previous or console.size != size:
+                size = console.size
+                live.update(_main_menu(current, settings, dois), refresh=True)
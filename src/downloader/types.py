@@ -2,7 +2,7 @@
 """Type definitions for the PDF downloader."""
 
 import threading
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, TypedDict
 
@@ -33,3 +33,5 @@ class DownloadContext:
     citation: str
     metadata: dict[str, Any]
     cancel_event: threading.Event | None = None
+    # PDF links found during the metadata phase, by source name, first found first.
+    pdf_urls: dict[str, str] = field(default_factory=dict)
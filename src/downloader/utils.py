@@ -2,19 +2,28 @@
 """Utility functions for the downloader."""
 
 import re
+from collections.abc import Iterable
+from itertools import zip_longest
 
 import requests
 
 from .config import MAX_FILENAME_LEN
 
+# Separators accepted between pasted DOIs (\s already covers newlines).
+DOI_SPLIT_REGEX = re.compile(r"[,\s]+")
+_FILENAME_ILLEGAL_REGEX = re.compile(r'[<>:"/\\|?*\n\r\t]+')
+_FILENAME_UNSAFE_REGEX = re.compile(r"[^A-Za-z0-9 _\-\.\(\)\[\],&]+")
+_DOI_URL_PREFIX_REGEX = re.compile(r"^https?://(dx\.)?doi\.org/", re.IGNORECASE)
+_DOI_REGEX = re.compile(r"^10\.\d{4,9}/.+$")
+
 
 def safe_filename(text: str) -> str:
     """
     Creates a cross-platform safe filename from a string.
     Removes illegal characters and truncates to a safe length.
     """
-    text = re.sub(r'[<>:"/\\|?*\n\r\t]+', "_", text)
-    text = re.sub(r"[^A-Za-z0-9 _\-\.\(\)\[\],&]+", "", text)
+    text = _FILENAME_ILLEGAL_REGEX.sub("_", text)
+    text = _FILENAME_UNSAFE_REGEX.sub("", text)
     return text.strip()[:MAX_FILENAME_LEN]
 
 
@@ -26,13 +35,24 @@ def clean_doi(doi: str) -> str | None:
     if not doi or not isinstance(doi, str):
         return None
 
-    doi = re.sub(r"^https?://(dx\.)?doi\.org/", "", doi.strip(), flags=re.IGNORECASE)
+    doi = _DOI_URL_PREFIX_REGEX.sub("", doi.strip())
     doi = doi.rstrip(".,;})] ")
 
-    if re.match(r"^10\.\d{4,9}/.+$", doi):
+    if _DOI_REGEX.match(doi):
         return doi
     return None
 
+
+def interleave_by_prefix(dois: Iterable[str]) -> list[str]:
+    """
+    Reorders DOIs round-robin across registrant prefixes, so consecutive
+    downloads go to different publishers instead of queuing on one host.
+    """
+    groups: dict[str, list[str]] = {}
+    for doi in dois:
+        groups.setdefault(doi.split("/", 1)[0], []).append(doi)
+    return [doi for batch in zip_longest(*groups.values()) for doi in batch if doi is not None]
+
 from urllib.parse import urljoin
 
 from bs4 import BeautifulSoup
@@ -31,7 +31,7 @@ def test_pipeline_flow():
     # Mock metadata_fetcher.fetch_metadata to control flow
     pipeline.metadata_fetcher.fetch_metadata = MagicMock(return_value=(
         {"title": "Test", "year": "2023", "authors": ["Me"], "doi": "10.1234/test"},
-        None
+        {},
     ))
     
     # Mock download_executor methods
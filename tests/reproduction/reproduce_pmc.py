@@ -3,6 +3,7 @@ from unittest.mock import MagicMock
 
 # Mock requests
 sys.modules["requests"] = MagicMock()
+sys.modules["requests.adapters"] = MagicMock()
 
 from src.downloader.sources import PubMedCentralSource
 
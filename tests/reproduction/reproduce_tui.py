@@ -1,3 +1,4 @@
+import re
 import sys
 import unittest
 from unittest.mock import MagicMock, patch
@@ -16,6 +17,7 @@ sys.modules["rich.align"] = MagicMock()
 sys.modules["rich.text"] = MagicMock()
 sys.modules["rich.table"] = MagicMock()
 sys.modules["rich.rule"] = MagicMock()
+sys.modules["rich.segment"] = MagicMock()
 
 # Mock internal modules
 sys.modules["src.downloader.settings_manager"] = MagicMock()
@@ -49,19 +51,20 @@ class TestTUI(unittest.TestCase):
         self.assertEqual(settings["email"], "email@example.com")
 
     @patch("src.downloader.tui.Prompt.ask")
-    @patch("src.downloader.tui.extract_dois_from_file")
+    @patch("src.downloader.tui.iter_dois_from_file")
     def test_get_dois_manual(self, mock_extract, mock_ask):
         mock_ask.side_effect = [
             "", # file input (empty for manual)
             "10.1000/1, 10.1000/2" # manual input
         ]
         # Mock clean_doi to return the input if it looks like a DOI
-        with patch("src.downloader.tui.clean_doi", side_effect=lambda x: x):
+        with patch("src.downloader.tui.clean_doi", side_effect=lambda x: x), \
+                patch("src.downloader.tui.DOI_SPLIT_REGEX", re.compile(r"[,\s]+")):
             dois = get_dois({})
             self.assertEqual(dois, ["10.1000/1", "10.1000/2"])
 
     @patch("src.downloader.tui.Downloader")
-    @patch("src.downloader.tui.Progress")
+    @patch("rich.progress.Progress")
     @patch("src.downloader.tui.Live")
     @patch("src.downloader.tui.ThreadPoolExecutor")
     def test_run_download(self, mock_executor, mock_live, mock_progress, mock_downloader):
@@ -76,9 +79,9 @@ class TestTUI(unittest.TestCase):
         mock_executor_instance.__enter__.return_value = mock_executor_instance
         mock_executor_instance.submit.return_value = mock_future
         
-        # Mock as_completed to yield the future
-        # Mock as_completed to yield the future
-        with patch("src.downloader.tui.as_completed", return_value=[mock_future]):
+        # Mock wait to report the future as done
+        with patch("src.downloader.tui.wait", return_value=({mock_future}, set())), \
+                patch("src.downloader.tui.interleave_by_prefix", side_effect=list):
             run_download({"output_dir": "out", "email": "e", "verify_ssl": True, "max_workers": 1}, ["10.1000/1"])
 
         # Assertions
@@ -88,6 +91,7 @@ class TestTUI(unittest.TestCase):
         self.assertEqual(kwargs["email"], "e")
         self.assertEqual(kwargs["verify_ssl"], True)
 
+        # The pool is sized for the tuner's ceiling; the setting is the starting limit.
         mock_executor.assert_called_once_with(max_workers=1)
         mock_executor_instance.submit.assert_called_once()
         
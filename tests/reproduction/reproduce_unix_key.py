@@ -13,26 +13,28 @@ from src.downloader.tui import _get_key_unix
 
 
 class TestUnixKey(unittest.TestCase):
+    @patch("src.downloader.tui.os.read")
     @patch("src.downloader.tui.sys.stdin")
-    def test_escape_sequence(self, mock_stdin):
+    def test_escape_sequence(self, mock_stdin, mock_read):
         # Simulate Escape followed by [A (Up Arrow)
-        # read(1) -> \x1b
-        # read(2) -> [A
-        mock_stdin.read.side_effect = ["\x1b", "[A"]
+        # read(fd, 1) -> \x1b
+        # read(fd, 2) -> [A
+        mock_read.side_effect = [b"\x1b", b"[A"]
         mock_stdin.fileno.return_value = 0
         
         # Mock select to return ready
-        sys.modules["select"].select.return_value = ([mock_stdin], [], [])
+        sys.modules["select"].select.return_value = ([0], [], [])
 
         key = _get_key_unix()
         self.assertEqual(key, "UP")
 
+    @patch("src.downloader.tui.os.read")
     @patch("src.downloader.tui.sys.stdin")
-    def test_standalone_escape(self, mock_stdin):
+    def test_standalone_escape(self, mock_stdin, mock_read):
         # Simulate Escape followed by nothing
-        # read(1) -> \x1b
-        # Should NOT call read(2) if select times out
-        mock_stdin.read.side_effect = ["\x1b"]
+        # read(fd, 1) -> \x1b
+        # Should NOT call read(fd, 2) if select times out
+        mock_read.side_effect = [b"\x1b"]
         mock_stdin.fileno.return_value = 0
         
         # Mock select to return empty (timeout)
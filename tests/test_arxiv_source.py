@@ -0,0 +1,141 @@
+import re
+
+import requests
+import responses
+
+from src.downloader.sources import ArxivSource
+
+ATOM_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+{entries}
+</feed>
+"""
+
+ENTRY = """  <entry>
+    <id>http://arxiv.org/abs/{arxiv_id}v1</id>
+    <published>{year}-01-15T00:00:00Z</published>
+    <title>{title}</title>
+    <author><name>Ada Lovelace</name></author>
+    <author><name>Alan Turing</name></author>
+  </entry>"""
+
+
+def _feed(*entries):
+    return ATOM_FEED.format(entries="\n".join(ENTRY.format(**e) for e in entries))
+
+
+@responses.activate
+def test_get_metadata_parses_entry():
+    """Test that a single arXiv lookup is parsed into the standard metadata shape."""
+    responses.add(
+        responses.GET,
+        re.compile(r"http://export\.arxiv\.org/api/query.*"),
+        body=_feed({"arxiv_id": "2101.00001", "year": "2021", "title": "Quantum\n Things"}),
+        status=200,
+    )
+    source = ArxivSource(requests.Session())
+    source._min_request_interval = 0
+
+    meta = source.get_metadata("10.48550/arXiv.2101.00001")
+
+    assert meta == {
+        "year": "2021",
+        "title": "Quantum  Things",
+        "authors": ["Ada Lovelace", "Alan Turing"],
+        "doi": "10.48550/arXiv.2101.00001",
+    }
+
+
+@responses.activate
+def test_get_metadata_batch_uses_one_request():
+    """Test that batched lookups share one id_list query and warm the cache."""
+    responses.add(
+        responses.GET,
+        re.compile(r"http://export\.arxiv\.org/api/query.*"),
+        body=_feed(
+            {"arxiv_id": "2101.00001", "year": "2021", "title": "First"},
+            {"arxiv_id": "2202.00002", "year": "2022", "title": "Second"},
+        ),
+        status=200,
+    )
+    source = ArxivSource(requests.Session())
+    source._min_request_interval = 0
+    dois = ["10.48550/arXiv.2101.00001", "10.48550/arXiv.2202.00002", "10.1234/not-arxiv"]
+
+    results = source.get_metadata_batch(dois)
+
+    assert len(responses.calls) == 1
+    assert "id_list=2101.00001%2C2202.00002" in responses.calls[0].request.url
+    assert results[dois[0]]["title"] == "First"
+    assert results[dois[1]]["year"] == "2022"
+    assert results[dois[2]] is None
+
+    # Served from the cache, no further requests.
+    assert source.get_metadata(dois[1])["title"] == "Second"
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_failed_batch_falls_back_to_single_lookup():
+    """Test that a failed batch query leaves the cache empty for retries."""
+    responses.add(
+        responses.GET, re.compile(r"http://export\.arxiv\.org/api/query.*"), status=400
+    )
+    responses.add(
+        responses.GET,
+        re.compile(r"http://export\.arxiv\.org/api/query.*"),
+        body=_feed({"arxiv_id": "2101.00001", "year": "2021", "title": "First"}),
+        status=200,
+    )
+    source = ArxivSource(requests.Session())
+    source._min_request_interval = 0
+    doi = "10.48550/arXiv.2101.00001"
+
+    assert source.get_metadata_batch([doi]) == {doi: None}
+    assert source.get_metadata(doi)["title"] == "First"
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_get_metadata_batch_requeries_cached_misses():
+    """Test that only real cached results are skipped by a batch lookup."""
+    responses.add(
+        responses.GET,
+        re.compile(r"http://export\.arxiv\.org/api/query.*"),
+        body=_feed({"arxiv_id": "2202.00002", "year": "2022", "title": "Second"}),
+        status=200,
+    )
+    source = ArxivSource(requests.Session())
+    source._min_request_interval = 0
+    found, missed = "10.48550/arXiv.2202.00002", "10.48550/arXiv.2101.00001"
+    source._metadata_memo[found] = {"title": "Cached"}
+
+    results = source.get_metadata_batch([found, missed])
+
+    assert len(responses.calls) == 1
+    assert "id_list=2101.00001&" in responses.calls[0].request.url
+    assert results[found] == {"title": "Cached"}
+    assert results[missed] is None
+
+
+@responses.activate
+def test_get_metadata_batch_results_share_the_bounded_memo(monkeypatch):
+    """Test that batch results obey the per-source memo limit."""
+    monkeypatch.setattr("src.downloader.sources.base.METADATA_MEMO_SIZE", 1)
+    responses.add(
+        responses.GET,
+        re.compile(r"http://export\.arxiv\.org/api/query.*"),
+        body=_feed(
+            {"arxiv_id": "2101.00001", "year": "2021", "title": "First"},
+            {"arxiv_id": "2202.00002", "year": "2022", "title": "Second"},
+        ),
+        status=200,
+    )
+    source = ArxivSource(requests.Session())
+    source._min_request_interval = 0
+    dois = ["10.48550/arXiv.2101.00001", "10.48550/arXiv.2202.00002"]
+
+    results = source.get_metadata_batch(dois)
+
+    assert [results[doi]["title"] for doi in dois] == ["First", "Second"]
+    assert list(source._metadata_memo) == [dois[1]]
@@ -72,3 +72,72 @@ def test_download_one_failed(downloader):
     result = downloader.download_one(doi)
     assert result["status"] == "failed"
     assert result["doi"] == doi
+
+
+@responses.activate
+def test_download_one_rejects_malformed_doi(downloader):
+    """A malformed DOI fails without querying any source."""
+    result = downloader.download_one("not a doi")
+
+    assert result["status"] == "failed"
+    assert len(responses.calls) == 0
+    assert downloader.stats["fail"] == 1
+
+
+def test_reset_stats_keeps_pipeline_reference(downloader):
+    """Reusing a Downloader must not carry counts over, nor detach the pipeline's stats."""
+    downloader.stats["success"] = 3
+    downloader.stats["sources"]["Unpaywall"] = 3
+
+    downloader.reset_stats()
+
+    assert downloader.stats == {"success": 0, "fail": 0, "skipped": 0, "sources": {}}
+    assert downloader.pipeline.stats is downloader.stats
+
+
+def test_reset_stats_forgets_memoized_metadata(downloader):
+    """A reused Downloader must not serve the previous run's lookups."""
+    source = downloader.source_manager.zenodo_source
+    source._metadata_memo["10.5281/a"] = {"title": "Old"}
+
+    downloader.reset_stats()
+
+    assert not source._metadata_memo
+
+
+def test_memoized_metadata_keeps_only_hits(downloader):
+    """Failed lookups are retried instead of being served from the memo."""
+    source = downloader.source_manager.zenodo_source
+    answers = iter([None, {"title": "Found"}])
+
+    assert source._memoized_metadata("10.5281/a", lambda doi: next(answers)) is None
+    assert source._memoized_metadata("10.5281/a", lambda doi: next(answers)) == {"title": "Found"}
+    assert source._memoized_metadata("10.5281/a", lambda doi: next(answers)) == {"title": "Found"}
+
+
+def test_downloaders_share_connections_not_headers(mock_output_dir):
+    """Each Downloader keeps its own User-Agent while reusing the pooled adapter."""
+    first = Downloader(str(mock_output_dir), "a@example.com", None)
+    second = Downloader(str(mock_output_dir), "b@example.com", None)
+    try:
+        assert first.session is not second.session
+        assert first.session.get_adapter("https://x") is second.session.get_adapter("https://x")
+        user_agent = first.session.headers["User-Agent"]
+        second.session.headers["User-Agent"] = "other"
+        assert first.session.headers["User-Agent"] == user_agent
+    finally:
+        first.close()
+        second.close()
+
+
+def test_memoized_metadata_is_bounded(downloader, monkeypatch):
+    """Only the most recently used lookups are kept."""
+    monkeypatch.setattr("src.downloader.sources.base.METADATA_MEMO_SIZE", 2)
+    source = downloader.source_manager.zenodo_source
+
+    for doi in ("10.5281/a", "10.5281/b"):
+        source._memoized_metadata(doi, lambda d: {"doi": d})
+    source._memoized_metadata("10.5281/a", lambda d: None)  # refreshes "a"
+    source._memoized_metadata("10.5281/c", lambda d: {"doi": d})
+
+    assert list(source._metadata_memo) == ["10.5281/a", "10.5281/c"]
@@ -0,0 +1,54 @@
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from src.downloader.download_executor import DownloadExecutor
+from src.downloader.sources.base import Source
+from src.downloader.types import DownloadContext
+
+DEAD_URL = "https://oa.example.org/dead.pdf"
+ALT_URL = "https://repo.example.org/alt.pdf"
+
+
+class _FallbackSource(Source):
+    """Tries the link it was given (or its own), then a second location."""
+
+    def __init__(self):
+        super().__init__(MagicMock(headers={}))
+        self._min_request_interval = 0
+        self.fetched = []
+
+    def get_metadata(self, doi):
+        return {"_pdf_url": DEAD_URL}
+
+    def download(self, doi, filepath, metadata):
+        url = metadata.get("_pdf_url") or self.get_metadata(doi)["_pdf_url"]
+        return self._fetch_and_save(url, filepath) or self._fetch_and_save(ALT_URL, filepath)
+
+    def _attempt_direct_download(self, url, headers, filepath):
+        self.fetched.append(url)
+        return url == ALT_URL
+
+    def _attempt_fallback_download(self, url, filepath):
+        return False
+
+def test_source_whose_primary_link_failed_still_tries_its_fallback(tmp_path):
+    source = _FallbackSource()
+    manager = MagicMock()
+    manager.pipeline_for.return_value = [source]
+    stats = {"success": 0, "fail": 0, "skipped": 0, "sources": {}}
+    executor = DownloadExecutor(manager, stats, threading.Lock())
+    ctx = DownloadContext(
+        doi="10.1234/x",
+        filepath=Path(tmp_path / "x.pdf"),
+        filename="x.pdf",
+        citation="x",
+        metadata={},
+        pdf_urls={source.name: DEAD_URL},
+    )
+
+    result = executor.try_pipeline_sources(ctx)
+
+    assert result["status"] == "success"
+    assert source.fetched == [ALT_URL]
+    assert stats["sources"] == {source.name: 1}
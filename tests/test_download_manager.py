@@ -75,6 +75,7 @@ def test_download_success_happy_path(test_manager_components, mock_downloader_in
 
     # Assert
     # 1. Check that the downloader was called correctly
+    mock_downloader_instance.prefetch_metadata.assert_called_once_with(["doi_1", "doi_2"])
     expected_calls = [
         call("doi_1", manager._cancel_event),
         call("doi_2", manager._cancel_event),
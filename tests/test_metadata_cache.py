@@ -0,0 +1,57 @@
+from unittest.mock import MagicMock, patch
+
+from src.downloader import metadata_cache
+from src.downloader.metadata_cache import MetadataCache
+
+
+def test_get_or_fetch_only_calls_source_once(tmp_path):
+    cache = MetadataCache(tmp_path / "cache.db")
+    fetch = MagicMock(return_value=({"title": "T", "authors": ["A"]}, True))
+
+    assert cache.get_or_fetch("Crossref", "10.1/x", fetch) == {"title": "T", "authors": ["A"]}
+    assert cache.get_or_fetch("Crossref", "10.1/x", fetch) == {"title": "T", "authors": ["A"]}
+    fetch.assert_called_once()
+
+
+def test_cache_survives_reopen(tmp_path):
+    cache = MetadataCache(tmp_path / "cache.db")
+    cache.put("OpenAlex", "10.1/x", {"title": "T"})
+    cache.close()
+
+    fetch = MagicMock()
+    reopened = MetadataCache(tmp_path / "cache.db")
+    assert reopened.get_or_fetch("OpenAlex", "10.1/x", fetch) == {"title": "T"}
+    fetch.assert_not_called()
+
+
+def test_misses_expire_sooner_than_hits(tmp_path):
+    cache = MetadataCache(tmp_path / "cache.db")
+    with patch("src.downloader.metadata_cache.time.time", return_value=1_000_000):
+        cache.put("Crossref", "10.1/hit", {"title": "T"})
+        cache.put("Crossref", "10.1/miss", None)
+
+    later = 1_000_000 + metadata_cache.NEGATIVE_TTL + 1
+    with patch("src.downloader.metadata_cache.time.time", return_value=later):
+        assert cache.get("Crossref", "10.1/hit") == {"title": "T"}
+        assert cache.get("Crossref", "10.1/miss") is metadata_cache._MISS
+
+
+def test_failed_lookups_are_not_cached(tmp_path):
+    cache = MetadataCache(tmp_path / "cache.db")
+    fetch = MagicMock(return_value=(None, False))
+
+    assert cache.get_or_fetch("Crossref", "10.1/x", fetch) is None
+    assert cache.get_or_fetch("Crossref", "10.1/x", fetch) is None
+    assert fetch.call_count == 2
+
+
+def test_writes_after_close_are_dropped(tmp_path):
+    cache = MetadataCache(tmp_path / "cache.db")
+    cache.close()
+
+    cache.put("Crossref", "10.1/x", {"title": "Late"})
+    cache.record_source_attempt("10.1", "Crossref", True)
+
+    assert not cache._pending_metadata
+    assert not cache._pending_stats
+    assert cache.source_stats() == []
@@ -0,0 +1,63 @@
+import threading
+from types import SimpleNamespace
+
+from src.downloader.metadata_fetcher import METADATA_WORKERS_PER_SOURCE, MetadataFetcher
+
+
+class FakeSource:
+    def __init__(self, name, metadata=None, gate=None):
+        self.name = name
+        self.metadata = metadata
+        self.gate = gate
+        self.calls = 0
+
+    def get_metadata(self, doi):
+        self.calls += 1
+        if self.gate:
+            self.gate.wait(5)
+        return self.metadata
+
+
+def test_fetch_metadata_returns_without_waiting_for_slow_sources():
+    gate = threading.Event()
+    crossref = FakeSource("Crossref", {"title": "T", "doi": "10.1/x"})
+    slow = FakeSource("Slow", {"title": "Other"}, gate=gate)
+    fetcher = MetadataFetcher(SimpleNamespace(metadata_sources=[slow, crossref]))
+
+    metadata, pdf_urls = fetcher.fetch_metadata("10.1/x")
+    gate.set()
+
+    assert metadata == {"title": "T", "doi": "10.1/x"}
+    assert pdf_urls == {}
+
+
+def test_fetch_metadata_picks_up_pdf_url_from_later_source():
+    first = FakeSource("OSF", {"title": "T"})
+    second = FakeSource("OpenAlex", {"title": "T2", "_pdf_url": "https://x/p.pdf"})
+    fetcher = MetadataFetcher(SimpleNamespace(metadata_sources=[first, second]))
+
+    metadata, pdf_urls = fetcher.fetch_metadata("10.1/x")
+
+    assert metadata is not None
+    assert pdf_urls == {"OpenAlex": "https://x/p.pdf"}
+
+
+def test_timeout_starts_when_a_queued_lookup_begins(monkeypatch):
+    monkeypatch.setattr("src.downloader.metadata_fetcher.METADATA_TIMEOUT", 0.2)
+    crossref = FakeSource("Crossref", {"title": "T"})
+    fetcher = MetadataFetcher(SimpleNamespace(metadata_sources=[crossref]), max_workers=1)
+    # Occupy the only lookup thread for longer than the timeout.
+    fetcher._executor.submit(threading.Event().wait, 0.4)
+
+    metadata, _ = fetcher.fetch_metadata("10.1/x")
+    fetcher.close()
+
+    assert metadata == {"title": "T"}
+
+
+def test_lookup_pool_is_capped_per_source():
+    sources = [FakeSource("Crossref"), FakeSource("OpenAlex")]
+    fetcher = MetadataFetcher(SimpleNamespace(metadata_sources=sources), max_workers=32)
+    fetcher.close()
+
+    assert fetcher._executor._max_workers == len(sources) * METADATA_WORKERS_PER_SOURCE
@@ -2,7 +2,7 @@ import textwrap
 
 import pytest
 
-from src.downloader.parsers import extract_dois_from_file
+from src.downloader.parsers import SNIFF_SIZE, extract_dois_from_file, iter_dois_from_file
 
 
 def test_extract_bibtex(tmp_path):
@@ -85,4 +85,15 @@ def test_extract_json(tmp_path):
 def test_file_not_found():
     """Test that a non-existent file raises the correct error."""
     with pytest.raises(FileNotFoundError):
-        extract_dois_from_file("non_existent_file.bib")
\ No newline at end of file
+        extract_dois_from_file("non_existent_file.bib")
+
+def test_iter_dois_streams_large_plain_text(tmp_path):
+    """Plain text larger than the sniff window is still fully scanned."""
+    filler = "x" * 60
+    lines = [f"{filler} 10.1000/line{i}" for i in range(SNIFF_SIZE // 40)]
+    p = tmp_path / "big.txt"
+    p.write_text("\n".join(lines), encoding="utf-8")
+
+    dois = iter_dois_from_file(str(p))
+    assert next(dois) == "10.1000/line0"
+    assert len(set(dois)) == len(lines) - 1
@@ -0,0 +1,100 @@
+from unittest.mock import MagicMock
+
+import requests
+
+from src.downloader.metadata_cache import MetadataCache
+from src.downloader.source_manager import SourceManager
+
+
+def _manager():
+    return SourceManager(requests.Session(), "test@example.com", None)
+
+
+def test_pipeline_for_routes_owned_prefixes_first():
+    manager = _manager()
+
+    pipeline = manager.pipeline_for("10.48550/arXiv.2101.00001")
+
+    assert pipeline[0] is manager.arxiv_source
+    assert sorted(s.name for s in pipeline) == sorted(s.name for s in manager.pipeline)
+
+
+def test_pipeline_for_prefers_sources_that_succeeded_for_the_prefix():
+    manager = _manager()
+    assert manager.pipeline_for("10.1234/a") == manager.pipeline
+
+    for source in manager.pipeline:
+        manager.record_attempt("10.1234/a", source.name, source is manager.openalex_source)
+
+    pipeline = manager.pipeline_for("10.1234/b")
+    assert pipeline[0] is manager.openalex_source
+    assert pipeline[-1] is manager.doi_resolver_source
+    assert manager.pipeline_for("10.9999/c") == manager.pipeline
+
+
+def test_pipeline_for_tries_unseen_sources_before_failing_ones():
+    manager = _manager()
+    first = manager.pipeline[0]
+
+    manager.record_attempt("10.1234/a", first.name, False)
+
+    assert manager.pipeline_for("10.1234/b")[-2:] == [first, manager.doi_resolver_source]
+
+
+def test_pipeline_for_keeps_proven_sources_ahead_of_unseen_ones():
+    manager = _manager()
+    proven = manager.semantic_scholar_source
+    for _ in range(10):
+        manager.record_attempt("10.1234/a", proven.name, True)
+
+    pipeline = manager.pipeline_for("10.1234/b")
+
+    assert pipeline[0] is proven
+    assert pipeline[1:] == [s for s in manager.pipeline if s is not proven]
+
+
+def test_pipeline_for_keeps_failing_sources_behind_proven_ones():
+    manager = _manager()
+    proven, failing = manager.zenodo_source, manager.core_source
+    for _ in range(10):
+        manager.record_attempt("10.1234/a", proven.name, True)
+        manager.record_attempt("10.1234/a", failing.name, False)
+
+    pipeline = manager.pipeline_for("10.1234/b")
+
+    assert pipeline[0] is proven
+    assert pipeline[-2:] == [failing, manager.doi_resolver_source]
+
+    # One failure among many tries does not lift a source above a proven one.
+    once = manager.unpaywall_source
+    manager.record_attempt("10.1234/a", once.name, False)
+    pipeline = manager.pipeline_for("10.1234/b")
+    assert pipeline.index(once) > pipeline.index(proven)
+
+
+def test_source_stats_persist_in_store(tmp_path):
+    store = MetadataCache(tmp_path / "cache.db")
+    manager = _manager()
+    manager.use_stats_store(store)
+    manager.record_attempt("10.1234/a", manager.pipeline[0].name, False)
+    store.close()
+
+    reloaded = _manager()
+    reloaded.use_stats_store(MetadataCache(tmp_path / "cache.db"))
+
+    assert reloaded.pipeline_for("10.1234/b")[-2] is reloaded.pipeline[0]
+
+
+def test_lookup_metadata_only_trusts_answers_from_the_api():
+    manager = _manager()
+    source = manager.zenodo_source
+    source.session = MagicMock()
+
+    source.session.request.side_effect = requests.ConnectionError("down")
+    assert source.lookup_metadata("10.5281/a") == (None, False)
+
+    not_found = MagicMock(status_code=404)
+    not_found.raise_for_status.side_effect = requests.HTTPError(response=not_found)
+    source.session.request.side_effect = None
+    source.session.request.return_value = not_found
+    assert source.lookup_metadata("10.5281/b") == (None, True)
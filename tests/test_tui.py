@@ -0,0 +1,57 @@
+from unittest.mock import patch
+
+from src.downloader.tui import _WorkerTuner
+
+
+def _finish_wave(tuner, nbytes, clock, seconds):
+    clock["now"] += seconds
+    for _ in range(tuner.limit):
+        tuner.record(nbytes)
+
+
+def test_worker_tuner_grows_from_minimum_to_configured_workers():
+    clock = {"now": 0.0}
+    with patch("src.downloader.tui.time.monotonic", side_effect=lambda: clock["now"]):
+        tuner = _WorkerTuner(12)
+        assert tuner.limit == _WorkerTuner.MIN_WORKERS
+
+        _finish_wave(tuner, 1000, clock, 1.0)  # first wave always probes upwards
+        assert tuner.limit == 8
+
+        _finish_wave(tuner, 1000, clock, 1.0)  # more bytes in the same time
+        assert tuner.limit == 12
+
+        _finish_wave(tuner, 1000, clock, 1.0)  # capped at max_workers
+        assert tuner.limit == 12
+
+
+def test_worker_tuner_settles_when_throughput_keeps_dropping():
+    clock = {"now": 0.0}
+    with patch("src.downloader.tui.time.monotonic", side_effect=lambda: clock["now"]):
+        tuner = _WorkerTuner(32)
+        for _ in range(3):
+            _finish_wave(tuner, 1000, clock, 1.0)
+        assert tuner.limit == 16
+
+        limits = []
+        for seconds in (2.0, 4.0, 8.0, 16.0, 32.0):
+            _finish_wave(tuner, 1000, clock, seconds)
+            limits.append(tuner.limit)
+        assert limits == [12, 8, 4, 4, 4]
+
+        # Recovered throughput no longer pushes it back up.
+        _finish_wave(tuner, 10_000, clock, 1.0)
+        assert tuner.limit == 4
+
+
+def test_worker_tuner_stays_within_configured_workers():
+    clock = {"now": 0.0}
+    with patch("src.downloader.tui.time.monotonic", side_effect=lambda: clock["now"]):
+        tuner = _WorkerTuner(2)
+        assert tuner.ceiling == tuner.limit == 2
+
+        _finish_wave(tuner, 1000, clock, 1.0)
+        assert tuner.limit == 2
+
+        _finish_wave(tuner, 0, clock, 1.0)
+        assert tuner.limit == 2